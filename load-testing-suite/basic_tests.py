@@ -7,7 +7,7 @@ import asyncio
 import httpx
 import time
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -24,23 +24,30 @@ class BasicTestResult:
 
 
 class BasicTester:
-    def __init__(self, agent_urls: Dict[str, str]):
+    def __init__(self, agent_urls: Dict[str, str], client: Optional[httpx.AsyncClient] = None):
         self.agent_urls = agent_urls
         self.results = []
         self.timeout = 15.0
+        self.client = client
     
     async def run_all_basic_tests(self) -> List[BasicTestResult]:
         """Run all basic tests - 9 requests total"""
         print("Starting Level 1: Basic Tests")
         
+        if self.client is not None:
+            return await self._run_basic_tests(self.client)
+        
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            health_results = await self.health_check_test(client)
-            spec_results = await self.agent_spec_test(client) 
-            capabilities_results = await self.capabilities_test(client)
-            
-            all_results = health_results + spec_results + capabilities_results
-            self.results.extend(all_results)
-            return all_results
+            return await self._run_basic_tests(client)
+    
+    async def _run_basic_tests(self, client: httpx.AsyncClient) -> List[BasicTestResult]:
+        health_results = await self.health_check_test(client)
+        spec_results = await self.agent_spec_test(client) 
+        capabilities_results = await self.capabilities_test(client)
+        
+        all_results = health_results + spec_results + capabilities_results
+        self.results.extend(all_results)
+        return all_results
     
     async def health_check_test(self, client: httpx.AsyncClient) -> List[BasicTestResult]:
         """Test /health endpoints - 3 requests"""
@@ -50,7 +57,7 @@ class BasicTester:
             start_time = time.time()
             
             try:
-                response = await client.get(f"{url}/health")
+                response = await client.get(f"{url}/health", timeout=self.timeout)
                 response_time = time.time() - start_time
                 
                 if response.status_code == 200:
@@ -99,7 +106,7 @@ class BasicTester:
             start_time = time.time()
             
             try:
-                response = await client.get(f"{url}/spec")
+                response = await client.get(f"{url}/spec", timeout=self.timeout)
                 response_time = time.time() - start_time
                 
                 if response.status_code == 200:
@@ -152,7 +159,7 @@ class BasicTester:
             start_time = time.time()
             
             try:
-                response = await client.get(f"{url}/capabilities")
+                response = await client.get(f"{url}/capabilities", timeout=self.timeout)
                 response_time = time.time() - start_time
                 
                 if response.status_code == 200:
@@ -239,9 +246,9 @@ class BasicTester:
         }
 
 
-async def run_basic_tests(agent_urls: Dict[str, str]) -> Dict[str, Any]:
+async def run_basic_tests(agent_urls: Dict[str, str], client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
     """Main function to run basic tests"""
-    tester = BasicTester(agent_urls)
+    tester = BasicTester(agent_urls, client=client)
     
     start_time = time.time()
     results = await tester.run_all_basic_tests()
@@ -253,16 +260,7 @@ async def run_basic_tests(agent_urls: Dict[str, str]) -> Dict[str, Any]:
         "test_type": "basic_tests",
         "timestamp": datetime.utcnow().isoformat(),
         "execution_time": total_time,
-        "results": [
-            {
-                "test_name": r.test_name,
-                "agent_name": r.agent_name,
-                "success": r.success,
-                "response_time": r.response_time,
-                "status_code": r.status_code,
-                "error": r.error,
-                "result_data": r.result_data
-            } for r in results
-        ],
+        # orjson serializes the result dataclasses directly, field for field
+        "results": results,
         "analysis": analysis
     }
\ No newline at end of file
@@ -6,19 +6,18 @@ Enhanced Load Test Dashboard - Based on dashboard_old architecture
 import os
 import uvicorn
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from datetime import datetime
 
 from data_processor import DataProcessor
 from chart_generator import ChartGenerator
-from html_generator import HTMLGenerator
+from html_generator import generate_dashboard_bytes
 
 app = FastAPI(title="Enhanced Load Test Dashboard", version="2.1.0")
 
 # Initialize components
 data_processor = DataProcessor()
 chart_generator = ChartGenerator()
-html_generator = HTMLGenerator()
 
 @app.get("/", response_class=HTMLResponse)
 async def dashboard_home():
@@ -37,9 +36,8 @@ async def dashboard_home():
     # Generate charts data
     agent_comparison_data = chart_generator.generate_agent_comparison_data(agent_stats)
     
-    # Generate HTML
-    html_content = html_generator.generate_dashboard_html(
-        test_results=test_results,
+    # Everything is computed up front, so send one pre-encoded body with a Content-Length
+    html_bytes = generate_dashboard_bytes(
         current_status=current_status,
         agent_stats=agent_stats,
         basic_metrics=basic_metrics,
@@ -48,7 +46,7 @@ async def dashboard_home():
         agent_comparison_data=agent_comparison_data
     )
     
-    return html_content
+    return Response(content=html_bytes, media_type="text/html")
 
 @app.get("/api/tests")
 async def api_tests():
@@ -66,6 +64,12 @@ async def api_tests():
         "redis_connected": data_processor.redis_connected
     }
 
+@app.get("/api/tests/recent")
+async def api_recent_tests():
+    """Rows for the Recent Test Results table"""
+    test_results = data_processor.get_test_results()
+    return {"tests": data_processor.summarize_recent_tests(test_results)}
+
 @app.get("/api/test/{test_id}")
 async def api_get_test(test_id: str):
     """Get specific test details"""
@@ -87,4 +91,4 @@ async def api_metrics():
 if __name__ == "__main__":
     print("Enhanced Dashboard started")
     print(f"Redis: {'Connected' if data_processor.redis_connected else 'Failed'}")
-    uvicorn.run(app, host="0.0.0.0", port=8081)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8081, loop="uvloop", http="httptools", access_log=False)
\ No newline at end of file
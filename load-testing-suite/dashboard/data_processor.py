@@ -7,9 +7,15 @@ import os
 import json
 import redis
 import statistics
+import time
+from itertools import islice
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+_EMPTY: dict = {}
+# Seconds to reuse loaded results; spans a page render and the recent-tests fetch it triggers
+RESULTS_CACHE_TTL = 10.0
+
 class DataProcessor:
     def __init__(self):
         self.redis_url = os.getenv("REDIS_URL", "redis://redis:6379")
@@ -20,9 +26,20 @@ class DataProcessor:
             print(f"Redis connection failed: {e}")
             self.redis_client = None
             self.redis_connected = False
+        self._results_cache = {"expires_at": 0.0, "results": []}
+        self._recent_rows_cache = {"results": None, "limit": 0, "rows": []}
     
     def get_test_results(self) -> List[Dict]:
-        """Get all test results from Redis and files"""
+        """Get all test results from Redis and files, reusing a recent load; treat the list as read-only"""
+        if time.monotonic() < self._results_cache["expires_at"]:
+            return self._results_cache["results"]
+        
+        test_results = self._load_test_results()
+        self._results_cache = {"expires_at": time.monotonic() + RESULTS_CACHE_TTL, "results": test_results}
+        return test_results
+    
+    def _load_test_results(self) -> List[Dict]:
+        """Scan Redis and the results directory for every stored test result"""
         test_results = []
         
         # From Redis
@@ -88,6 +105,39 @@ class DataProcessor:
         
         return None
 
+    def summarize_recent_tests(self, test_results: List[Dict], limit: int = 15) -> List[Dict]:
+        """Build the per-row fields of the Recent Test Results table"""
+        # The same cached results list summarizes to the same rows
+        cached = self._recent_rows_cache
+        if cached["results"] is test_results and cached["limit"] == limit:
+            return cached["rows"]
+        
+        rows = []
+        
+        for test in islice(test_results, limit):
+            analysis_overall = test.get("analysis", _EMPTY).get("overall", _EMPTY)
+            
+            # Calculate average response time
+            try:
+                avg_response_time = statistics.fmean(
+                    r["response_time"] for r in test.get("results", ())
+                    if r.get("success") and "response_time" in r
+                )
+            except statistics.StatisticsError:
+                avg_response_time = 0
+            
+            rows.append({
+                "test_id": test.get("test_id", ""),
+                "test_name": test.get("test_name", "Unknown"),
+                "timestamp": test.get("timestamp", "")[:19].replace("T", " "),
+                "total_requests": test.get("total_requests", 0),
+                "success_rate": analysis_overall.get("overall_success_rate", 0),
+                "avg_response_time": avg_response_time
+            })
+        
+        self._recent_rows_cache = {"results": test_results, "limit": limit, "rows": rows}
+        return rows
+
     def calculate_agent_stats(self, test_results: List[Dict]) -> Dict:
         """Calculate per-agent statistics (enhanced with dashboard features)"""
         agent_stats = {}
@@ -4,9 +4,12 @@ Main orchestrator for basic, functional, and workflow tests
 """
 
 import asyncio
+import httpx
 import time
 import os
-from typing import Dict, List, Any
+import orjson
+from collections import defaultdict
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 # Import test modules
@@ -19,33 +22,47 @@ class EnhancedLoadTester:
     def __init__(self, agent_urls: Dict[str, str]):
         self.agent_urls = agent_urls
         self.test_results = {}
-        
+        self.client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self) -> "EnhancedLoadTester":
+        # Shared by every level so connections to the agents are set up once
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=45.0,
+            limits=httpx.Limits(max_connections=128, max_keepalive_connections=32, keepalive_expiry=60)
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.client.aclose()
+        self.client = None
+    
     async def run_level(self, level: int) -> Dict[str, Any]:
         """Run tests for specific level"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if level == 1:
             print("Running Level 1: Basic Tests (9 requests)")
-            tester = BasicTester(self.agent_urls)
+            tester = BasicTester(self.agent_urls, client=self.client)
             results = await tester.run_all_basic_tests()
             analysis = self._analyze_basic_results(results)
             
         elif level == 2:
             print("Running Level 2: Functional Tests (12-18 requests)")
-            tester = FunctionalTester(self.agent_urls)
+            tester = FunctionalTester(self.agent_urls, client=self.client)
             results = await tester.run_all_functional_tests()
             analysis = self._analyze_functional_results(results)
             
         elif level == 3:
             print("Running Level 3: Workflow Tests (15-18 requests)")
-            tester = WorkflowTester(self.agent_urls)
-            results = await tester.run_all_workflow_tests()
+            tester = WorkflowTester(self.agent_urls, self.client)
+            results = await tester.run_all_workflows()
             analysis = self._analyze_workflow_results(results)
             
         else:
             raise ValueError(f"Invalid test level: {level}")
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         return {
             "level": level,
@@ -56,71 +73,87 @@ class EnhancedLoadTester:
         }
     
     async def run_all_levels(self) -> Dict[str, Any]:
-        """Run all test levels sequentially"""
+        """Run all test levels concurrently"""
         print("Starting Enhanced Load Testing Suite")
         print("="*50)
         
-        all_results = {}
-        total_start = time.time()
-        
-        for level in [1, 2, 3]:
-            try:
-                level_results = await self.run_level(level)
-                all_results[f"level_{level}"] = level_results
-                
-                # Small delay between levels
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                print(f"Level {level} failed: {e}")
-                all_results[f"level_{level}"] = {
-                    "level": level,
-                    "error": str(e),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-        
-        total_time = time.time() - total_start
-        
-        # Overall analysis
-        overall_analysis = self._analyze_overall_results(all_results)
+        await self._prewarm()
+        
+        total_start = time.perf_counter()
+        
+        # Levels are independent, so let their requests overlap
+        level_results = await asyncio.gather(*(self._run_level_safely(level) for level in [1, 2, 3]))
+        all_results = {f"level_{level_data['level']}": level_data for level_data in level_results}
+        
+        total_time = time.perf_counter() - total_start
+        
+        # Count once and share with the overall analysis
+        levels_successful = sum(1 for v in all_results.values() if "error" not in v)
+        total_requests = sum(v.get("analysis", {}).get("total_tests", 0) for v in all_results.values())
+        overall_analysis = self._analyze_overall_results(all_results, levels_successful, total_requests)
         
         return {
             "test_suite": "enhanced_load_testing",
             "timestamp": datetime.utcnow().isoformat(),
             "total_execution_time": total_time,
-            "levels_completed": len([v for v in all_results.values() if "error" not in v]),
+            "levels_completed": levels_successful,
             "results": all_results,
             "overall_analysis": overall_analysis
         }
     
+    async def _prewarm(self) -> None:
+        """Resolve DNS and open a connection to each agent before the timed tests"""
+        if self.client is None:
+            return
+        await asyncio.gather(
+            *(self.client.head(url) for url in self.agent_urls.values()),
+            return_exceptions=True
+        )
+    
+    async def _run_level_safely(self, level: int) -> Dict[str, Any]:
+        """Run a level, recording a failure instead of raising"""
+        try:
+            return await self.run_level(level)
+        except Exception as e:
+            print(f"Level {level} failed: {e}")
+            return {
+                "level": level,
+                "error": str(e),
+                "timestamp": datetime.utcnow().isoformat()
+            }
+    
     def _analyze_basic_results(self, results: List) -> Dict[str, Any]:
         """Analyze basic test results"""
         if not results:
             return {"error": "No basic test results"}
         
         total_tests = len(results)
-        successful_tests = len([r for r in results if r.success])
-        avg_response_time = sum([r.response_time for r in results]) / total_tests
+        successful_tests = 0
+        response_time_sum = 0.0
+        agent_stats = defaultdict(lambda: {"total": 0, "success": 0, "time_sum": 0.0})
         
-        agent_stats = {}
+        # Single pass over the results
         for result in results:
-            if result.agent_name not in agent_stats:
-                agent_stats[result.agent_name] = {"total": 0, "success": 0, "avg_time": 0}
-            
-            agent_stats[result.agent_name]["total"] += 1
+            stats = agent_stats[result.agent_name]
+            stats["total"] += 1
+            response_time_sum += result.response_time
             if result.success:
-                agent_stats[result.agent_name]["success"] += 1
+                successful_tests += 1
+                stats["success"] += 1
+                stats["time_sum"] += result.response_time
         
         # Calculate success rates
-        for agent, stats in agent_stats.items():
+        for stats in agent_stats.values():
+            time_sum = stats.pop("time_sum")
+            stats["avg_time"] = time_sum / stats["success"] if stats["success"] else 0
             stats["success_rate"] = (stats["success"] / stats["total"] * 100) if stats["total"] > 0 else 0
         
         return {
             "total_tests": total_tests,
             "successful_tests": successful_tests,
             "success_rate": (successful_tests / total_tests * 100) if total_tests > 0 else 0,
-            "average_response_time": avg_response_time,
-            "agent_stats": agent_stats
+            "average_response_time": response_time_sum / total_tests,
+            "agent_stats": dict(agent_stats)
         }
     
     def _analyze_functional_results(self, results: List) -> Dict[str, Any]:
@@ -129,26 +162,25 @@ class EnhancedLoadTester:
             return {"error": "No functional test results"}
         
         total_tests = len(results)
-        successful_tests = len([r for r in results if r.success])
+        successful_tests = 0
+        test_types = defaultdict(lambda: {"total": 0, "success": 0})
         
-        test_types = {}
         for result in results:
-            if result.test_name not in test_types:
-                test_types[result.test_name] = {"total": 0, "success": 0}
-            
-            test_types[result.test_name]["total"] += 1
+            stats = test_types[result.test_name]
+            stats["total"] += 1
             if result.success:
-                test_types[result.test_name]["success"] += 1
+                successful_tests += 1
+                stats["success"] += 1
         
         # Calculate success rates per test type
-        for test_type, stats in test_types.items():
+        for stats in test_types.values():
             stats["success_rate"] = (stats["success"] / stats["total"] * 100) if stats["total"] > 0 else 0
         
         return {
             "total_tests": total_tests,
             "successful_tests": successful_tests,
             "success_rate": (successful_tests / total_tests * 100) if total_tests > 0 else 0,
-            "test_type_stats": test_types
+            "test_type_stats": dict(test_types)
         }
     
     def _analyze_workflow_results(self, results: List) -> Dict[str, Any]:
@@ -157,10 +189,11 @@ class EnhancedLoadTester:
             return {"error": "No workflow test results"}
         
         total_workflows = len(results)
-        successful_workflows = len([r for r in results if r.success])
+        successful_workflows = 0
         
         workflow_stats = {}
         for result in results:
+            successful_workflows += result.success
             workflow_stats[result.workflow_name] = {
                 "success": result.success,
                 "execution_time": result.total_time,
@@ -175,15 +208,9 @@ class EnhancedLoadTester:
             "workflow_details": workflow_stats
         }
     
-    def _analyze_overall_results(self, all_results: Dict) -> Dict[str, Any]:
+    def _analyze_overall_results(self, all_results: Dict, levels_successful: int, total_requests: int) -> Dict[str, Any]:
         """Analyze overall test suite results"""
         levels_run = len(all_results)
-        levels_successful = len([v for v in all_results.values() if "error" not in v])
-        
-        total_requests = 0
-        for level_name, level_data in all_results.items():
-            if "analysis" in level_data:
-                total_requests += level_data["analysis"].get("total_tests", 0)
         
         return {
             "levels_run": levels_run,
@@ -193,6 +220,12 @@ class EnhancedLoadTester:
         }
 
 
+def _write_results(path: str, results: Dict[str, Any]) -> None:
+    """Write results as JSON - orjson serializes the result dataclasses and datetimes natively"""
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC, default=str))
+
+
 # Standalone execution
 async def main():
     """Main function for standalone execution"""
@@ -207,28 +240,26 @@ async def main():
         if "localhost" in url:
             print(f"Warning: {name} using localhost URL: {url}")
     
-    tester = EnhancedLoadTester(agent_urls)
+    async with EnhancedLoadTester(agent_urls) as tester:
+        # Run specific level or all
+        test_level = int(os.getenv("TEST_LEVEL", "0"))
     
-    # Run specific level or all
-    test_level = int(os.getenv("TEST_LEVEL", "0"))
-    
-    if test_level in [1, 2, 3]:
-        results = await tester.run_level(test_level)
-        print(f"\nLevel {test_level} Results:")
-        print(f"Success Rate: {results['analysis']['success_rate']:.1f}%")
-    else:
-        results = await tester.run_all_levels()
-        print(f"\nOverall Results:")
-        print(f"Levels Completed: {results['levels_completed']}/3")
-        print(f"Total Requests: {results['overall_analysis']['total_requests_sent']}")
+        if test_level in [1, 2, 3]:
+            results = await tester.run_level(test_level)
+            print(f"\nLevel {test_level} Results:")
+            print(f"Success Rate: {results['analysis']['success_rate']:.1f}%")
+        else:
+            results = await tester.run_all_levels()
+            print(f"\nOverall Results:")
+            print(f"Levels Completed: {results['levels_completed']}/3")
+            print(f"Total Requests: {results['overall_analysis']['total_requests_sent']}")
     
     # Save results
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"enhanced_test_results_{timestamp}.json"
     
-    import json
-    with open(f"/app/results/{filename}", "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    # Serialize and write off the event loop
+    await asyncio.to_thread(_write_results, f"/app/results/{filename}", results)
     
     print(f"\nResults saved to: {filename}")
 
@@ -5,15 +5,17 @@ Target: 12-15 requests total
 """
 import asyncio
 import httpx
+import orjson
 import time
 import json
 import uuid
-from typing import Dict, List, Any
+from collections import defaultdict
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FunctionalTestResult:
     test_name: str
     agent_name: str
@@ -25,398 +27,315 @@ class FunctionalTestResult:
     error: str = ""
 
 
+class CircuitBreaker:
+    """Stops sending requests to an agent after repeated connection failures or timeouts"""
+    
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+    
+    @property
+    def is_open(self) -> bool:
+        if self.opened_at is None:
+            return False
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            # Let the next request probe the agent again
+            self.opened_at = None
+            self.failures = 0
+            return False
+        return True
+    
+    def record_success(self) -> None:
+        self.failures = 0
+    
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+A2A_MESSAGE_TEMPLATE = {
+    "message_type": "health_check",
+    "sender_id": "load_tester",
+    "payload": {"test": True}
+}
+
+REALISTIC_TASKS = {
+    "crewai": [
+        {
+            "task_type": "research",
+            "description": "Research AI trends in enterprise software for 2025",
+            "context": {"focus": "automation", "industry": "software"}
+        },
+        {
+            "task_type": "analysis", 
+            "description": "Analyze market opportunities for AI agents",
+            "context": {"market": "enterprise", "scope": "productivity"}
+        }
+    ],
+    "langraph": [
+        {
+            "task_type": "decision_making",
+            "description": "Choose optimal deployment strategy for AI system",
+            "context": {
+                "options": ["cloud_first", "hybrid", "on_premise"],
+                "criteria": {"cost": "medium", "security": "high"}
+            }
+        },
+        {
+            "task_type": "routing",
+            "description": "Route customer requests to appropriate services",
+            "context": {
+                "input_data": {"type": "support", "priority": "medium"},
+                "routing_rules": {"support": "service_desk", "sales": "sales_team"}
+            }
+        }
+    ],
+    "adk": [
+        {
+            "task_type": "data_analysis",
+            "description": "Analyze customer satisfaction data trends",
+            "context": {
+                "data": {
+                    "values": [4.2, 3.8, 4.5, 4.1, 3.9, 4.3],
+                    "categories": ["product", "service", "support"]
+                },
+                "analysis_type": "descriptive"
+            }
+        },
+        {
+            "task_type": "data_validation",
+            "description": "Validate customer data quality",
+            "context": {
+                "data": {
+                    "records": [
+                        {"id": 1, "email": "user@company.com", "age": 30},
+                        {"id": 2, "email": "invalid.email", "age": 25}
+                    ]
+                },
+                "validation_rules": {"email_format": True, "age_range": {"min": 18, "max": 65}}
+            }
+        }
+    ]
+}
+
+# Realistic tasks never change, so serialize each request body once at import
+REALISTIC_TASK_BYTES = {
+    agent_name: [(task, orjson.dumps(task)) for task in tasks]
+    for agent_name, tasks in REALISTIC_TASKS.items()
+}
+
+
 class FunctionalTester:
-    def __init__(self, agent_urls: Dict[str, str]):
+    def __init__(self, agent_urls: Dict[str, str], client: Optional[httpx.AsyncClient] = None):
         self.agent_urls = agent_urls
         self.results = []
         self.timeout = 45.0
+        # Cap in-flight requests per agent instead of pacing with fixed sleeps
+        self._agent_sem = {name: asyncio.Semaphore(4) for name in agent_urls}
+        self._breakers = {name: CircuitBreaker() for name in agent_urls}
+        # An injected client is owned by the caller and never closed here
+        self._client = client
+        self._owns_client = False
+    
+    async def __aenter__(self) -> "FunctionalTester":
+        if self._client is None:
+            # One pooled client for the tester's lifetime so keep-alive connections are reused
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=60)
+            )
+            self._owns_client = True
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+            self._client = None
+            self._owns_client = False
     
     async def run_all_functional_tests(self) -> List[FunctionalTestResult]:
         """Run all functional tests - 12-15 requests total"""
         print("Starting Level 2: Functional Tests")
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            a2a_results = await self.a2a_messaging_test(client)
-            task_results = await self.realistic_task_test(client)
-            integration_results = await self.cross_agent_integration_test(client)
-            
-            all_results = a2a_results + task_results + integration_results
-            self.results.extend(all_results)
-            return all_results
+        if self._client is None:
+            async with self:
+                return await self._run_functional_tests(self._client)
+        return await self._run_functional_tests(self._client)
+    
+    async def _run_functional_tests(self, client: httpx.AsyncClient) -> List[FunctionalTestResult]:
+        a2a_results = await self.a2a_messaging_test(client)
+        task_results = await self.realistic_task_test(client)
+        integration_results = await self.cross_agent_integration_test(client)
+        
+        all_results = a2a_results + task_results + integration_results
+        self.results.extend(all_results)
+        return all_results
     
     async def a2a_messaging_test(self, client: httpx.AsyncClient) -> List[FunctionalTestResult]:
         """Test A2A messaging between agents - 3 requests"""
-        results = []
+        # One timestamp per batch; only the message id varies per agent
+        now_iso = datetime.now(timezone.utc).isoformat()
         
+        tasks = []
         for agent_name, url in self.agent_urls.items():
-            start_time = time.time()
-            
-            try:
-                a2a_message = {
-                    "message_id": str(uuid.uuid4()),
-                    "message_type": "health_check",
-                    "sender_id": "load_tester",
-                    "payload": {"test": True},
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-                response = await client.post(
-                    f"{url}/a2a/message",
-                    json=a2a_message
-                )
-                response_time = time.time() - start_time
-                
-                if response.status_code == 200:
-                    response_data = response.json()
-                    
-                    success = response_data.get("success", False)
-                    
-                    results.append(FunctionalTestResult(
-                        test_name="a2a_messaging",
-                        agent_name=agent_name,
-                        success=success,
-                        response_time=response_time,
-                        status_code=response.status_code,
-                        task_data=a2a_message,
-                        result_data=response_data
-                    ))
-                else:
-                    results.append(FunctionalTestResult(
-                        test_name="a2a_messaging",
-                        agent_name=agent_name,
-                        success=False,
-                        response_time=response_time,
-                        status_code=response.status_code,
-                        task_data=a2a_message,
-                        result_data={},
-                        error=f"HTTP {response.status_code}"
-                    ))
-                    
-            except Exception as e:
-                response_time = time.time() - start_time
-                results.append(FunctionalTestResult(
-                    test_name="a2a_messaging",
-                    agent_name=agent_name,
-                    success=False,
-                    response_time=response_time,
-                    status_code=0,
-                    task_data={},
-                    result_data={},
-                    error=str(e)
-                ))
-            
-            await asyncio.sleep(2)
+            a2a_message = {**A2A_MESSAGE_TEMPLATE, "message_id": uuid.uuid4().hex, "timestamp": now_iso}
+            tasks.append(self._timed_post(client, agent_name, f"{url}/a2a/message", a2a_message, "a2a_messaging"))
         
-        return results
+        return list(await asyncio.gather(*tasks))
     
     async def realistic_task_test(self, client: httpx.AsyncClient) -> List[FunctionalTestResult]:
         """Test realistic task execution - 6 requests"""
-        results = []
-        
-        realistic_tasks = {
-            "crewai": [
-                {
-                    "task_type": "research",
-                    "description": "Research AI trends in enterprise software for 2025",
-                    "context": {"focus": "automation", "industry": "software"}
-                },
-                {
-                    "task_type": "analysis", 
-                    "description": "Analyze market opportunities for AI agents",
-                    "context": {"market": "enterprise", "scope": "productivity"}
-                }
-            ],
-            "langraph": [
-                {
-                    "task_type": "decision_making",
-                    "description": "Choose optimal deployment strategy for AI system",
-                    "context": {
-                        "options": ["cloud_first", "hybrid", "on_premise"],
-                        "criteria": {"cost": "medium", "security": "high"}
-                    }
-                },
-                {
-                    "task_type": "routing",
-                    "description": "Route customer requests to appropriate services",
-                    "context": {
-                        "input_data": {"type": "support", "priority": "medium"},
-                        "routing_rules": {"support": "service_desk", "sales": "sales_team"}
-                    }
-                }
-            ],
-            "adk": [
-                {
-                    "task_type": "data_analysis",
-                    "description": "Analyze customer satisfaction data trends",
-                    "context": {
-                        "data": {
-                            "values": [4.2, 3.8, 4.5, 4.1, 3.9, 4.3],
-                            "categories": ["product", "service", "support"]
-                        },
-                        "analysis_type": "descriptive"
-                    }
-                },
-                {
-                    "task_type": "data_validation",
-                    "description": "Validate customer data quality",
-                    "context": {
-                        "data": {
-                            "records": [
-                                {"id": 1, "email": "user@company.com", "age": 30},
-                                {"id": 2, "email": "invalid.email", "age": 25}
-                            ]
-                        },
-                        "validation_rules": {"email_format": True, "age_range": {"min": 18, "max": 65}}
-                    }
-                }
-            ]
-        }
-        
-        for agent_name, url in self.agent_urls.items():
-            if agent_name not in realistic_tasks:
-                continue
-                
-            for task in realistic_tasks[agent_name]:
-                start_time = time.time()
-                
-                try:
-                    response = await client.post(f"{url}/execute", json=task)
-                    response_time = time.time() - start_time
-                    
-                    if response.status_code == 200:
-                        result_data = response.json()
-                        success = result_data.get("success", False)
-                        
-                        results.append(FunctionalTestResult(
-                            test_name="realistic_task",
-                            agent_name=agent_name,
-                            success=success,
-                            response_time=response_time,
-                            status_code=response.status_code,
-                            task_data=task,
-                            result_data=result_data
-                        ))
-                    else:
-                        results.append(FunctionalTestResult(
-                            test_name="realistic_task",
-                            agent_name=agent_name,
-                            success=False,
-                            response_time=response_time,
-                            status_code=response.status_code,
-                            task_data=task,
-                            result_data={},
-                            error=f"HTTP {response.status_code}"
-                        ))
-                        
-                except Exception as e:
-                    response_time = time.time() - start_time
-                    results.append(FunctionalTestResult(
-                        test_name="realistic_task",
-                        agent_name=agent_name,
-                        success=False,
-                        response_time=response_time,
-                        status_code=0,
-                        task_data=task,
-                        result_data={},
-                        error=str(e)
-                    ))
-                
-                await asyncio.sleep(3)
+        jobs = [
+            (agent_name, url, task, body)
+            for agent_name, url in self.agent_urls.items()
+            if agent_name in REALISTIC_TASK_BYTES
+            for task, body in REALISTIC_TASK_BYTES[agent_name]
+        ]
+        coros = [
+            self._timed_post(client, agent_name, f"{url}/execute", task, "realistic_task", body=body)
+            for agent_name, url, task, body in jobs
+        ]
         
+        # Collect in completion order so a slow agent doesn't hold back the others
+        results = []
+        for next_result in asyncio.as_completed(coros):
+            results.append(await next_result)
         return results
     
     async def cross_agent_integration_test(self, client: httpx.AsyncClient) -> List[FunctionalTestResult]:
         """Test cross-agent integration - 3-6 requests"""
-        results = []
+        tasks = []
         
         # Test 1: CrewAI -> LangGraph collaboration
         if "crewai" in self.agent_urls and "langraph" in self.agent_urls:
-            start_time = time.time()
-            
-            try:
-                collaboration_task = {
-                    "task_type": "research",
-                    "description": "Research product launch strategies",
-                    "context": {"product": "AI assistant", "market": "enterprise"},
-                    "collaborators": {
-                        "decision_maker": self.agent_urls["langraph"]
-                    }
+            collaboration_task = {
+                "task_type": "research",
+                "description": "Research product launch strategies",
+                "context": {"product": "AI assistant", "market": "enterprise"},
+                "collaborators": {
+                    "decision_maker": self.agent_urls["langraph"]
                 }
-                
-                response = await client.post(
-                    f"{self.agent_urls['crewai']}/execute",
-                    json=collaboration_task
-                )
-                response_time = time.time() - start_time
-                
-                if response.status_code == 200:
-                    result_data = response.json()
-                    success = result_data.get("success", False)
-                    has_collaboration = "collaboration" in result_data.get("result", {})
-                    
-                    results.append(FunctionalTestResult(
-                        test_name="cross_agent_integration",
-                        agent_name="crewai_to_langraph",
-                        success=success and has_collaboration,
-                        response_time=response_time,
-                        status_code=response.status_code,
-                        task_data=collaboration_task,
-                        result_data=result_data
-                    ))
-                else:
-                    results.append(FunctionalTestResult(
-                        test_name="cross_agent_integration",
-                        agent_name="crewai_to_langraph",
-                        success=False,
-                        response_time=response_time,
-                        status_code=response.status_code,
-                        task_data=collaboration_task,
-                        result_data={},
-                        error=f"HTTP {response.status_code}"
-                    ))
-                    
-            except Exception as e:
-                response_time = time.time() - start_time
-                results.append(FunctionalTestResult(
-                    test_name="cross_agent_integration",
-                    agent_name="crewai_to_langraph",
-                    success=False,
-                    response_time=response_time,
-                    status_code=0,
-                    task_data={},
-                    result_data={},
-                    error=str(e)
-                ))
-            
-            await asyncio.sleep(3)
+            }
+            tasks.append(self._timed_post(
+                client, "crewai", f"{self.agent_urls['crewai']}/execute", collaboration_task,
+                "cross_agent_integration", agent_name="crewai_to_langraph", require_collaboration=True
+            ))
         
         # Test 2: LangGraph -> ADK collaboration
         if "langraph" in self.agent_urls and "adk" in self.agent_urls:
-            start_time = time.time()
-            
-            try:
-                collaboration_task = {
-                    "task_type": "decision_making",
-                    "description": "Decide on data processing approach",
-                    "context": {
-                        "options": ["batch", "stream", "hybrid"],
-                        "criteria": {"speed": "high", "accuracy": "critical"}
-                    },
-                    "collaborators": {
-                        "data_processor": self.agent_urls["adk"]
-                    }
+            collaboration_task = {
+                "task_type": "decision_making",
+                "description": "Decide on data processing approach",
+                "context": {
+                    "options": ["batch", "stream", "hybrid"],
+                    "criteria": {"speed": "high", "accuracy": "critical"}
+                },
+                "collaborators": {
+                    "data_processor": self.agent_urls["adk"]
                 }
-                
-                response = await client.post(
-                    f"{self.agent_urls['langraph']}/execute",
-                    json=collaboration_task
-                )
-                response_time = time.time() - start_time
-                
-                if response.status_code == 200:
-                    result_data = response.json()
-                    success = result_data.get("success", False)
-                    has_collaboration = "collaboration" in result_data.get("result", {})
-                    
-                    results.append(FunctionalTestResult(
-                        test_name="cross_agent_integration",
-                        agent_name="langraph_to_adk",
-                        success=success and has_collaboration,
-                        response_time=response_time,
-                        status_code=response.status_code,
-                        task_data=collaboration_task,
-                        result_data=result_data
-                    ))
-                else:
-                    results.append(FunctionalTestResult(
-                        test_name="cross_agent_integration",
-                        agent_name="langraph_to_adk",
-                        success=False,
-                        response_time=response_time,
-                        status_code=response.status_code,
-                        task_data=collaboration_task,
-                        result_data={},
-                        error=f"HTTP {response.status_code}"
-                    ))
-                    
-            except Exception as e:
-                response_time = time.time() - start_time
-                results.append(FunctionalTestResult(
-                    test_name="cross_agent_integration",
-                    agent_name="langraph_to_adk",
+            }
+            tasks.append(self._timed_post(
+                client, "langraph", f"{self.agent_urls['langraph']}/execute", collaboration_task,
+                "cross_agent_integration", agent_name="langraph_to_adk", require_collaboration=True
+            ))
+        
+        # Test 3: ADK -> CrewAI collaboration
+        if "adk" in self.agent_urls and "crewai" in self.agent_urls:
+            collaboration_task = {
+                "task_type": "data_analysis",
+                "description": "Analyze sales data for insights",
+                "context": {
+                    "data": {"sales": [100, 150, 120, 180, 200]},
+                    "analysis_type": "trend"
+                },
+                "collaborators": {
+                    "researcher": self.agent_urls["crewai"]
+                }
+            }
+            tasks.append(self._timed_post(
+                client, "adk", f"{self.agent_urls['adk']}/execute", collaboration_task,
+                "cross_agent_integration", agent_name="adk_to_crewai", require_collaboration=True
+            ))
+        
+        return list(await asyncio.gather(*tasks))
+    
+    async def _timed_post(self, client: httpx.AsyncClient, target: str, url: str, payload: Dict[str, Any],
+                          test_name: str, agent_name: Optional[str] = None,
+                          require_collaboration: bool = False, body: Optional[bytes] = None) -> FunctionalTestResult:
+        """POST a payload to the target agent, time the round trip and wrap the outcome in a FunctionalTestResult"""
+        agent_name = agent_name or target
+        breaker = self._breakers[target]
+        
+        async with self._agent_sem[target]:
+            # Agent already proven down - fail fast instead of waiting out the timeout
+            if breaker.is_open:
+                return FunctionalTestResult(
+                    test_name=test_name,
+                    agent_name=agent_name,
                     success=False,
-                    response_time=response_time,
+                    response_time=0.0,
                     status_code=0,
-                    task_data={},
+                    task_data=payload,
                     result_data={},
-                    error=str(e)
-                ))
+                    error=f"Circuit open: {target} agent unreachable"
+                )
             
-            await asyncio.sleep(3)
-        
-        # Test 3: ADK -> CrewAI collaboration
-        if "adk" in self.agent_urls and "crewai" in self.agent_urls:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
-                collaboration_task = {
-                    "task_type": "data_analysis",
-                    "description": "Analyze sales data for insights",
-                    "context": {
-                        "data": {"sales": [100, 150, 120, 180, 200]},
-                        "analysis_type": "trend"
-                    },
-                    "collaborators": {
-                        "researcher": self.agent_urls["crewai"]
-                    }
-                }
+                if body is None:
+                    body = orjson.dumps(payload)
+                response = await client.post(url, content=body, headers=JSON_HEADERS, timeout=self.timeout)
+                response_time = time.perf_counter() - start_time
+                breaker.record_success()
                 
-                response = await client.post(
-                    f"{self.agent_urls['adk']}/execute",
-                    json=collaboration_task
-                )
-                response_time = time.time() - start_time
-                
-                if response.status_code == 200:
-                    result_data = response.json()
-                    success = result_data.get("success", False)
-                    has_collaboration = "collaboration" in result_data.get("result", {})
-                    
-                    results.append(FunctionalTestResult(
-                        test_name="cross_agent_integration",
-                        agent_name="adk_to_crewai",
-                        success=success and has_collaboration,
-                        response_time=response_time,
-                        status_code=response.status_code,
-                        task_data=collaboration_task,
-                        result_data=result_data
-                    ))
-                else:
-                    results.append(FunctionalTestResult(
-                        test_name="cross_agent_integration",
-                        agent_name="adk_to_crewai",
+                if response.status_code != 200:
+                    return FunctionalTestResult(
+                        test_name=test_name,
+                        agent_name=agent_name,
                         success=False,
                         response_time=response_time,
                         status_code=response.status_code,
-                        task_data=collaboration_task,
+                        task_data=payload,
                         result_data={},
                         error=f"HTTP {response.status_code}"
-                    ))
-                    
+                    )
+                
+                result_data = orjson.loads(response.content)
+                success = result_data.get("success", False)
+                if require_collaboration:
+                    success = success and "collaboration" in result_data.get("result", {})
+                
+                return FunctionalTestResult(
+                    test_name=test_name,
+                    agent_name=agent_name,
+                    success=success,
+                    response_time=response_time,
+                    status_code=response.status_code,
+                    task_data=payload,
+                    result_data=result_data
+                )
+                
             except Exception as e:
-                response_time = time.time() - start_time
-                results.append(FunctionalTestResult(
-                    test_name="cross_agent_integration",
-                    agent_name="adk_to_crewai",
+                response_time = time.perf_counter() - start_time
+                if isinstance(e, httpx.TransportError):
+                    breaker.record_failure()
+                return FunctionalTestResult(
+                    test_name=test_name,
+                    agent_name=agent_name,
                     success=False,
                     response_time=response_time,
                     status_code=0,
-                    task_data={},
+                    task_data=payload,
                     result_data={},
                     error=str(e)
-                ))
-        
-        return results
+                )
     
     def analyze_functional_results(self, results: List[FunctionalTestResult]) -> Dict[str, Any]:
         """Analyze functional test results"""
@@ -424,55 +343,48 @@ class FunctionalTester:
             return {"error": "No functional test results"}
         
         total_tests = len(results)
-        successful_tests = len([r for r in results if r.success])
+        successful_tests = 0
+        by_test_type = defaultdict(lambda: {"total": 0, "success": 0, "time_sum": 0.0})
         
-        by_test_type = {}
+        # Single pass: per-test-type counts and successful response time sums
         for result in results:
-            if result.test_name not in by_test_type:
-                by_test_type[result.test_name] = {"total": 0, "success": 0, "avg_time": 0}
-            by_test_type[result.test_name]["total"] += 1
-            if result.success:
-                by_test_type[result.test_name]["success"] += 1
+            stats = by_test_type[result.test_name]
+            stats["total"] += 1
+            success = result.success
+            if success:
+                successful_tests += 1
+                stats["success"] += 1
+                stats["time_sum"] += result.response_time
         
-        for test_name, stats in by_test_type.items():
-            test_results = [r for r in results if r.test_name == test_name]
-            response_times = [r.response_time for r in test_results if r.success]
-            stats["avg_time"] = sum(response_times) / len(response_times) if response_times else 0
+        for stats in by_test_type.values():
+            time_sum = stats.pop("time_sum")
+            stats["avg_time"] = time_sum / stats["success"] if stats["success"] else 0
         
-        a2a_tests = [r for r in results if r.test_name == "a2a_messaging"]
-        integration_tests = [r for r in results if r.test_name == "cross_agent_integration"]
-        realistic_tests = [r for r in results if r.test_name == "realistic_task"]
+        def category_summary(test_name: str) -> Dict[str, Any]:
+            stats = by_test_type.get(test_name, {"total": 0, "success": 0})
+            return {
+                "total": stats["total"],
+                "successful": stats["success"],
+                "success_rate": (stats["success"] / stats["total"] * 100) if stats["total"] else 0
+            }
         
         return {
             "total_tests": total_tests,
             "successful_tests": successful_tests,
             "success_rate": (successful_tests / total_tests * 100) if total_tests > 0 else 0,
-            "by_test_type": by_test_type,
-            "a2a_communication": {
-                "total": len(a2a_tests),
-                "successful": len([r for r in a2a_tests if r.success]),
-                "success_rate": (len([r for r in a2a_tests if r.success]) / len(a2a_tests) * 100) if a2a_tests else 0
-            },
-            "cross_agent_integration": {
-                "total": len(integration_tests),
-                "successful": len([r for r in integration_tests if r.success]),
-                "success_rate": (len([r for r in integration_tests if r.success]) / len(integration_tests) * 100) if integration_tests else 0
-            },
-            "realistic_tasks": {
-                "total": len(realistic_tests),
-                "successful": len([r for r in realistic_tests if r.success]),
-                "success_rate": (len([r for r in realistic_tests if r.success]) / len(realistic_tests) * 100) if realistic_tests else 0
-            }
+            "by_test_type": dict(by_test_type),
+            "a2a_communication": category_summary("a2a_messaging"),
+            "cross_agent_integration": category_summary("cross_agent_integration"),
+            "realistic_tasks": category_summary("realistic_task")
         }
 
 
-async def run_functional_tests(agent_urls: Dict[str, str]) -> Dict[str, Any]:
+async def run_functional_tests(agent_urls: Dict[str, str], client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
     """Main function to run functional tests"""
-    tester = FunctionalTester(agent_urls)
-    
-    start_time = time.time()
-    results = await tester.run_all_functional_tests()
-    total_time = time.time() - start_time
+    async with FunctionalTester(agent_urls, client=client) as tester:
+        start_time = time.perf_counter()
+        results = await tester.run_all_functional_tests()
+        total_time = time.perf_counter() - start_time
     
     analysis = tester.analyze_functional_results(results)
     
@@ -480,17 +392,7 @@ async def run_functional_tests(agent_urls: Dict[str, str]) -> Dict[str, Any]:
         "test_type": "functional_tests",
         "timestamp": datetime.utcnow().isoformat(),
         "execution_time": total_time,
-        "results": [
-            {
-                "test_name": r.test_name,
-                "agent_name": r.agent_name,
-                "success": r.success,
-                "response_time": r.response_time,
-                "status_code": r.status_code,
-                "error": r.error,
-                "task_data": r.task_data,
-                "result_data": r.result_data
-            } for r in results
-        ],
+        # orjson serializes the result dataclasses directly, field for field
+        "results": results,
         "analysis": analysis
     }
\ No newline at end of file
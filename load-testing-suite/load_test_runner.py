@@ -5,12 +5,21 @@ Enhanced Load Test Runner with 3-level testing system
 
 import asyncio
 import os
-import json
-import redis
+import re
+import time
+import httpx
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 import uvicorn
+from contextlib import asynccontextmanager
 from datetime import datetime
+from uuid import uuid4
+from pathlib import Path
 from typing import Dict, List, Optional
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 
 # Import test modules
@@ -24,18 +33,62 @@ LANGRAPH_URL = os.getenv("LANGRAPH_URL", "https://langraph-agent-REPLACE.run.app
 ADK_URL = os.getenv("ADK_URL", "https://adk-agent-REPLACE.run.app")
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379")
 TEST_LEVEL = int(os.getenv("TEST_LEVEL", "1"))
+TEST_LEVELS = (1, 2, 3)
+# Indexed by test level; slot 0 is unused
+LEVEL_RUNNERS = (
+    None,
+    ("basic tests", run_basic_tests),
+    ("functional tests", run_functional_tests),
+    ("workflow tests", run_workflow_tests)
+)
+ESTIMATED_REQUESTS = (0, 9, 15, 18)
+RESULTS_TTL = 86400  # Stored results expire after 24 hours
+RESULTS_INDEX_KEY = "tests:index"  # Sorted set of test IDs scored by expiry time
+RUNNING_TESTS_KEY = "tests:active"  # Sorted set of tests started on any worker, scored by expiry time
+TEST_SLOTS_KEY = "tests:slots"  # Sorted set of tests holding an execution slot, scored by lease expiry
+RUNNING_TEST_TTL = 3600  # A crashed worker's entries age out of both sets after an hour
+SLOT_POLL_INTERVAL = 1.0  # Seconds between attempts to take a slot while queued
+MAX_PARALLEL_TESTS = int(os.getenv("MAX_PARALLEL_TESTS", "4"))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "2"))
+RESULTS_DIR = "/app/results"
+RESULT_FILE_PATTERN = re.compile(r"load_test_results_(.+)\.json")
+RESULT_FILES_CACHE_TTL = 5.0  # Seconds to reuse a results directory listing
 
-app = FastAPI(title="3-Level Agent Load Tester API", version="2.0.0")
+# Drops expired leases, then takes a slot only if fewer than the limit are held - atomically for all workers
+ACQUIRE_SLOT_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+    return 1
+end
+return 0
+"""
+
+app = FastAPI(title="3-Level Agent Load Tester API", version="2.0.0", default_response_class=ORJSONResponse)
+# Result payloads are large and repetitive; compress anything over 1 KB
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Redis connection
 try:
-    redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+    # Raw bytes: stored JSON is returned to clients without a decode step
+    redis_client = aioredis.from_url(REDIS_URL)
+    acquire_slot = redis_client.register_script(ACQUIRE_SLOT_SCRIPT)
 except Exception as e:
     print(f"Redis connection failed: {e}")
     redis_client = None
+    acquire_slot = None
+
+# Tests started by this process (test ID -> level), in start order
+running_tests: Dict[str, int] = {}
+
+# Slot limit for this process, used only when there is no Redis to share one across workers
+local_test_slots = asyncio.Semaphore(MAX_PARALLEL_TESTS)
+
+# Latest status of tests run by this process, served without a Redis round trip
+latest_status: Dict[str, Dict] = {}
 
-# Global test state
-current_test_status = {"running": False, "test_id": None, "level": None}
+# Recent results directory listing, absorbs bursts of /test/results polling
+result_files_cache = {"expires_at": 0.0, "test_ids": []}
 
 class TestConfig(BaseModel):
     test_name: str = "default_test"
@@ -44,14 +97,6 @@ class TestConfig(BaseModel):
     langraph_url: Optional[str] = None
     adk_url: Optional[str] = None
 
-class TestStatus(BaseModel):
-    running: bool
-    test_id: Optional[str]
-    test_level: Optional[int]
-    progress: str
-    total_requests_sent: int = 0
-    current_test: str = ""
-
 @app.get("/")
 async def root():
     return {
@@ -82,21 +127,21 @@ async def get_config():
         "redis_connected": redis_client is not None,
         "test_levels_available": [1, 2, 3],
         "default_test_level": TEST_LEVEL,
-        "test_status": current_test_status
+        "test_status": {
+            "running_tests": list(running_tests),
+            "max_parallel_tests": MAX_PARALLEL_TESTS
+        }
     }
 
 @app.post("/test/start")
 async def start_test(config: TestConfig, background_tasks: BackgroundTasks):
     """Start a test at specified level"""
-    if current_test_status["running"]:
-        raise HTTPException(status_code=400, detail="Test already running")
-    
     # Validate test level
-    if config.test_level not in [1, 2, 3]:
+    if config.test_level not in TEST_LEVELS:
         raise HTTPException(status_code=400, detail="Test level must be 1, 2, or 3")
     
-    # Generate test ID
-    test_id = f"test_L{config.test_level}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    # Generate test ID - the suffix keeps tests started in the same second apart
+    test_id = f"test_L{config.test_level}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:8]}"
     
     # Update agent URLs if provided
     agent_urls = {
@@ -113,13 +158,20 @@ async def start_test(config: TestConfig, background_tasks: BackgroundTasks):
                 detail=f"Please provide valid URL for {name} agent"
             )
     
+    # Track the test for every worker - best effort, the test runs even if Redis is unreachable
+    if redis_client:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zremrangebyscore(RUNNING_TESTS_KEY, "-inf", time.time())
+                pipe.zadd(RUNNING_TESTS_KEY, {test_id: time.time() + RUNNING_TEST_TTL})
+                await pipe.execute()
+        except RedisError as e:
+            print(f"Could not register {test_id} in Redis: {e}")
+    running_tests[test_id] = config.test_level
+    
     # Start test in background
     background_tasks.add_task(run_level_test, test_id, config, agent_urls)
     
-    current_test_status["running"] = True
-    current_test_status["test_id"] = test_id
-    current_test_status["level"] = config.test_level
-    
     return {
         "test_id": test_id,
         "test_level": config.test_level,
@@ -130,77 +182,132 @@ async def start_test(config: TestConfig, background_tasks: BackgroundTasks):
     }
 
 @app.get("/test/status")
-async def get_test_status():
-    """Get current test status"""
-    if redis_client and current_test_status["test_id"]:
-        test_id = current_test_status["test_id"]
-        status_data = redis_client.get(f"test_status:{test_id}")
-        
+async def get_test_status(test_id: Optional[str] = None):
+    """Get test status - defaults to the most recently started running test"""
+    if test_id is None and running_tests:
+        test_id = next(reversed(running_tests))
+    elif test_id is None and redis_client:
+        # Tests may be running on another worker
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(RUNNING_TESTS_KEY, "-inf", time.time())
+            pipe.zrange(RUNNING_TESTS_KEY, 0, -1)
+            _, running_ids = await pipe.execute()
+        # IDs read test_L<level>_<timestamp>_<suffix>, so order them by what follows the level
+        test_id = max(running_ids, key=lambda t: t.split(b"_", 2)[2]).decode() if running_ids else None
+    
+    # Plain dict: ORJSONResponse serializes it without a response model pass
+    status = {
+        "running": False,
+        "test_id": test_id,
+        "test_level": extract_level_from_test_id(test_id) if test_id else None,
+        "progress": "Unknown",
+        "total_requests_sent": 0,
+        "current_test": ""
+    }
+    
+    if test_id in latest_status:
+        status["running"] = test_id in running_tests
+        status.update(latest_status[test_id])
+    elif redis_client and test_id:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zscore(RUNNING_TESTS_KEY, test_id)
+            pipe.get(f"test_status:{test_id}")
+            expires_at, status_data = await pipe.execute()
+        status["running"] = expires_at is not None and expires_at > time.time()
         if status_data:
-            detailed_status = json.loads(status_data)
-            return TestStatus(**detailed_status, **current_test_status)
+            status.update(orjson.loads(status_data))
     
-    return TestStatus(**current_test_status, progress="Unknown")
+    return status
 
 @app.get("/test/results/{test_id}")
 async def get_test_results(test_id: str):
     """Get test results by ID"""
     if redis_client:
-        results_data = redis_client.get(f"test_results:{test_id}")
+        results_data = await redis_client.get(f"test_results:{test_id}")
         if results_data:
-            return json.loads(results_data)
-    
-    # Fallback to file system
-    results_file = f"/app/results/load_test_results_{test_id}.json"
-    if os.path.exists(results_file):
-        with open(results_file, 'r') as f:
-            return json.load(f)
+            return Response(content=results_data, media_type="application/json")
     
-    raise HTTPException(status_code=404, detail="Test results not found")
+    # Fallback to file system - the file is already JSON, so serve it as is
+    results_file = Path(RESULTS_DIR) / f"load_test_results_{test_id}.json"
+    try:
+        results_bytes = await asyncio.to_thread(results_file.read_bytes)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Test results not found")
+    return Response(content=results_bytes, media_type="application/json")
 
 @app.get("/test/results")
 async def list_test_results():
     """List all available test results"""
     results = []
     
-    # Check Redis
+    # Check Redis - read the index instead of scanning the keyspace
     if redis_client:
-        for key in redis_client.scan_iter("test_results:*"):
-            test_id = key.replace("test_results:", "")
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(RESULTS_INDEX_KEY, "-inf", time.time())
+            pipe.zrange(RESULTS_INDEX_KEY, 0, -1)
+            _, test_ids = await pipe.execute()
+        for test_id in map(bytes.decode, test_ids):
             level = extract_level_from_test_id(test_id)
             results.append({"test_id": test_id, "level": level, "source": "redis"})
     
     # Check file system
-    results_dir = "/app/results"
-    if os.path.exists(results_dir):
-        for filename in os.listdir(results_dir):
-            if filename.startswith("load_test_results_") and filename.endswith(".json"):
-                test_id = filename.replace("load_test_results_", "").replace(".json", "")
-                level = extract_level_from_test_id(test_id)
-                if not any(r["test_id"] == test_id for r in results):
-                    results.append({"test_id": test_id, "level": level, "source": "file"})
+    seen = {r["test_id"] for r in results}
+    for test_id in list_result_file_ids():
+        if test_id not in seen:
+            results.append({"test_id": test_id, "level": extract_level_from_test_id(test_id), "source": "file"})
     
     return {"test_results": results}
 
+@asynccontextmanager
+async def test_slot(test_id: str):
+    """Hold one of MAX_PARALLEL_TESTS execution slots, shared by every worker through Redis
+    
+    Falls back to this process's semaphore when Redis is not configured or cannot be reached.
+    """
+    acquired = False
+    if redis_client is not None:
+        try:
+            while not acquired:
+                now = time.time()
+                acquired = bool(await acquire_slot(
+                    keys=[TEST_SLOTS_KEY], args=[now, now + RUNNING_TEST_TTL, MAX_PARALLEL_TESTS, test_id]
+                ))
+                if not acquired:
+                    await asyncio.sleep(SLOT_POLL_INTERVAL)
+        except RedisError as e:
+            print(f"Redis slot unavailable for {test_id}, using the local limit: {e}")
+    
+    if not acquired:
+        async with local_test_slots:
+            yield
+        return
+    
+    try:
+        yield
+    finally:
+        try:
+            await redis_client.zrem(TEST_SLOTS_KEY, test_id)
+        except RedisError as e:
+            # The lease expires on its own after RUNNING_TEST_TTL
+            print(f"Could not release the Redis slot of {test_id}: {e}")
+
 async def run_level_test(test_id: str, config: TestConfig, agent_urls: Dict[str, str]):
-    """Run test at specified level"""
+    """Run test at specified level once a test slot is free"""
     try:
-        update_test_status(test_id, "initializing", 0, f"Starting Level {config.test_level} test")
-        
-        start_time = datetime.now()
+        await update_test_status(test_id, "queued", 0, "Waiting for a free test slot")
         
-        # Run appropriate test level
-        if config.test_level == 1:
-            update_test_status(test_id, "running", 0, "Running basic tests")
-            test_results = await run_basic_tests(agent_urls)
-        elif config.test_level == 2:
-            update_test_status(test_id, "running", 0, "Running functional tests")
-            test_results = await run_functional_tests(agent_urls)
-        elif config.test_level == 3:
-            update_test_status(test_id, "running", 0, "Running workflow tests")
-            test_results = await run_workflow_tests(agent_urls)
-        else:
-            raise ValueError(f"Invalid test level: {config.test_level}")
+        async with test_slot(test_id):
+            await update_test_status(test_id, "initializing", 0, f"Starting Level {config.test_level} test")
+            
+            start_time = datetime.now()
+            
+            # Run appropriate test level
+            if config.test_level not in TEST_LEVELS:
+                raise ValueError(f"Invalid test level: {config.test_level}")
+            
+            description, runner = LEVEL_RUNNERS[config.test_level]
+            await update_test_status(test_id, "running", 0, f"Running {description}")
+            test_results = await runner(agent_urls, app.state.http)
         
         # Add test metadata
         test_results.update({
@@ -213,56 +320,94 @@ async def run_level_test(test_id: str, config: TestConfig, agent_urls: Dict[str,
             "agent_urls": agent_urls
         })
         
-        # Save results
-        save_test_results(test_id, test_results)
-        
-        update_test_status(test_id, "completed", len(test_results.get("results", [])), "Test completed successfully")
+        # Save results together with the final status
+        final_status = build_test_status("completed", len(test_results.get("results", [])), "Test completed successfully")
+        await save_test_results(test_id, test_results, final_status)
         
     except Exception as e:
         error_msg = f"Level {config.test_level} test failed: {str(e)}"
-        update_test_status(test_id, "failed", 0, error_msg)
+        await update_test_status(test_id, "failed", 0, error_msg)
         print(f"Test {test_id} failed: {e}")
     
     finally:
-        current_test_status["running"] = False
-        current_test_status["test_id"] = None
-        current_test_status["level"] = None
+        if redis_client:
+            await redis_client.zrem(RUNNING_TESTS_KEY, test_id)
+        latest_status.pop(test_id, None)
+        running_tests.pop(test_id, None)
 
-def save_test_results(test_id: str, test_results: Dict):
-    """Save test results to Redis and file"""
-    # Save to Redis
+async def save_test_results(test_id: str, test_results: Dict, status_data: Optional[Dict] = None):
+    """Save test results (and optionally the final status) to Redis and file"""
+    if status_data:
+        latest_status[test_id] = status_data
+    
+    results_bytes = orjson.dumps(test_results, option=orjson.OPT_NAIVE_UTC)
+    
+    # Save to Redis in a single round trip
     if redis_client:
-        redis_client.set(
-            f"test_results:{test_id}",
-            json.dumps(test_results),
-            ex=86400  # Expire after 24 hours
-        )
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(f"test_results:{test_id}", results_bytes, ex=RESULTS_TTL)
+            # Scored by expiry so entries age out together with their results key
+            pipe.zadd(RESULTS_INDEX_KEY, {test_id: time.time() + RESULTS_TTL})
+            if status_data:
+                pipe.set(f"test_status:{test_id}", orjson.dumps(status_data), ex=3600)
+            await pipe.execute()
     
-    # Save to file
-    os.makedirs("/app/results", exist_ok=True)
-    with open(f"/app/results/load_test_results_{test_id}.json", 'w') as f:
-        json.dump(test_results, f, indent=2)
+    # Save to file without blocking the event loop
+    await asyncio.to_thread(write_results_file, test_id, results_bytes)
+    # Make the new file visible to the next listing
+    result_files_cache["expires_at"] = 0.0
+
+def write_results_file(test_id: str, results_bytes: bytes):
+    """Write encoded test results to the results directory"""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(os.path.join(RESULTS_DIR, f"load_test_results_{test_id}.json"), 'wb') as f:
+        f.write(results_bytes)
 
-def update_test_status(test_id: str, status: str, requests_sent: int, current_test: str):
-    """Update test status in Redis"""
-    status_data = {
+def build_test_status(status: str, requests_sent: int, current_test: str) -> Dict:
+    """Build a test status record"""
+    return {
         "progress": status,
         "total_requests_sent": requests_sent,
         "current_test": current_test,
-        "timestamp": datetime.now().isoformat()
+        # Left as a datetime - orjson writes the same ISO-8601 text when the status is serialized
+        "timestamp": datetime.now()
     }
+
+async def update_test_status(test_id: str, status: str, requests_sent: int, current_test: str):
+    """Update test status in memory and in Redis"""
+    status_data = build_test_status(status, requests_sent, current_test)
+    latest_status[test_id] = status_data
     
     if redis_client:
-        redis_client.set(
+        await redis_client.set(
             f"test_status:{test_id}",
-            json.dumps(status_data),
+            orjson.dumps(status_data),
             ex=3600  # Expire after 1 hour
         )
 
 def get_estimated_requests(level: int) -> int:
     """Get estimated request count for test level"""
-    estimates = {1: 9, 2: 15, 3: 18}
-    return estimates.get(level, 9)
+    return ESTIMATED_REQUESTS[level] if level in TEST_LEVELS else ESTIMATED_REQUESTS[1]
+
+def list_result_file_ids() -> List[str]:
+    """List test IDs with a results file, reusing the listing for a few seconds"""
+    now = time.monotonic()
+    if now < result_files_cache["expires_at"]:
+        return result_files_cache["test_ids"]
+    
+    test_ids = []
+    try:
+        with os.scandir(RESULTS_DIR) as entries:
+            for entry in entries:
+                match = RESULT_FILE_PATTERN.fullmatch(entry.name)
+                if match:
+                    test_ids.append(match.group(1))
+    except FileNotFoundError:
+        pass
+    
+    result_files_cache["expires_at"] = now + RESULT_FILES_CACHE_TTL
+    result_files_cache["test_ids"] = test_ids
+    return test_ids
 
 def extract_level_from_test_id(test_id: str) -> int:
     """Extract test level from test ID"""
@@ -275,6 +420,23 @@ def extract_level_from_test_id(test_id: str) -> int:
 
 @app.on_event("startup")
 async def startup_event():
+    global redis_client, acquire_slot
+    # from_url() does not connect, so check Redis is actually reachable before relying on it
+    if redis_client is not None:
+        try:
+            await redis_client.ping()
+        except RedisError as e:
+            print(f"Redis connection failed: {e}")
+            redis_client = None
+            acquire_slot = None
+    
+    # One pooled client shared by every test run so connections and TLS sessions are reused
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=200)
+    )
+    
     print("3-Level Agent Load Tester started")
     print(f"Agent URLs:")
     print(f"  CrewAI: {CREWAI_URL}")
@@ -283,5 +445,18 @@ async def startup_event():
     print(f"Redis: {'Connected' if redis_client else 'Not connected'}")
     print(f"Default test level: {TEST_LEVEL}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await app.state.http.aclose()
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
+    # Workers share test state through Redis
+    uvicorn.run(
+        "load_test_runner:app",
+        host="0.0.0.0",
+        port=8080,
+        workers=WEB_CONCURRENCY,
+        loop="uvloop",
+        http="httptools",
+        access_log=False
+    )
\ No newline at end of file
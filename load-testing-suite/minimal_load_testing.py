@@ -6,14 +6,45 @@ Designed for free tier limits - max 30-50 API calls total
 
 import asyncio
 import httpx
+import logging
+import queue
+import socket
+import sys
 import time
-import json
-import statistics
+import orjson
+import math
+from collections import defaultdict, deque
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import Dict, List, Any
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
 from pathlib import Path
 
+# Output goes through a queue drained by a background thread, so stdout writes
+# never block the event loop while requests are in flight
+logger = logging.getLogger("minimal_load_testing")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _stdout_handler)
+_log_listener_users = 0
+
+def _acquire_log_listener():
+    global _log_listener_users
+    if _log_listener_users == 0:
+        _log_listener.start()
+    _log_listener_users += 1
+
+def _release_log_listener():
+    global _log_listener_users
+    _log_listener_users -= 1
+    if _log_listener_users == 0:
+        # Drains any queued lines before returning
+        _log_listener.stop()
+
 @dataclass
 class TestResult:
     test_name: str
@@ -23,345 +54,455 @@ class TestResult:
     success: bool
     error: str = ""
     timestamp: str = ""
+    effective_timeout: float = 0.0
+    error_code: str = ""
     
     def __post_init__(self):
         if not self.timestamp:
             self.timestamp = datetime.now().isoformat()
 
+# Adaptive timeouts: once an endpoint has enough successful samples, requests to it
+# time out at a multiple of its observed P99 instead of the flat default.
+# run_all_tests sees at most 4 successes per /health URL, so the threshold stays below that
+DEFAULT_TIMEOUT = 60.0
+ADAPTIVE_TIMEOUT_MIN_SAMPLES = 3
+ADAPTIVE_TIMEOUT_FLOOR = 2.0
+ADAPTIVE_TIMEOUT_MULTIPLIER = 3.0
+
+ERROR_MESSAGE_LIMIT = 120  # Characters of an exception message kept in a result
+
+# Constant request bodies, serialized once at import
+JSON_HEADERS = {"content-type": "application/json"}
+
+BASIC_TASKS = {
+    "crewai": {
+        "task_type": "research",
+        "description": "Quick test research",
+        "context": {"test": True}
+    },
+    "langraph": {
+        "task_type": "decision_making", 
+        "description": "Quick test decision",
+        "context": {"options": ["A", "B"], "criteria": {"test": "value"}}
+    },
+    "adk": {
+        "task_type": "data_transformation",
+        "description": "Quick test transformation",
+        "context": {"data": {"test": [1, 2, 3]}, "target_format": "json"}
+    }
+}
+BASIC_TASK_BYTES = {agent_name: orjson.dumps(task) for agent_name, task in BASIC_TASKS.items()}
+
+# Simple A2A health check message
+A2A_HEALTH_MESSAGE_BYTES = orjson.dumps({
+    "message_type": "health_check",
+    "sender_id": "test-client",
+    "payload": {"test": True}
+})
+
+@dataclass(frozen=True)
+class TestSpec:
+    """A single-request-per-agent test: what to send and how to summarize a 200 response"""
+    name: str
+    title: str
+    endpoint: str
+    method: str = "GET"
+    body_for: Callable[[str], Optional[bytes]] = lambda agent_name: None
+    describe: Optional[Callable[[httpx.Response], str]] = None
+
+HEALTH_CHECK_SPEC = TestSpec(
+    name="health_check",
+    title="health check",
+    endpoint="health",
+    describe=lambda response: response.json().get('status', 'unknown')
+)
+CAPABILITIES_SPEC = TestSpec(
+    name="capabilities",
+    title="capabilities",
+    endpoint="capabilities",
+    describe=lambda response: f"{len(response.json())} capabilities"
+)
+BASIC_TASK_SPEC = TestSpec(
+    name="basic_task",
+    title="basic task",
+    endpoint="execute",
+    method="POST",
+    body_for=lambda agent_name: BASIC_TASK_BYTES.get(agent_name, BASIC_TASK_BYTES["crewai"]),
+    describe=lambda response: f"Task executed={response.json().get('success', False)}"
+)
+A2A_COMMUNICATION_SPEC = TestSpec(
+    name="a2a_communication",
+    title="A2A communication",
+    endpoint="a2a",
+    method="POST",
+    body_for=lambda agent_name: A2A_HEALTH_MESSAGE_BYTES,
+    describe=lambda response: f"A2A response={response.json().get('success', False)}"
+)
+
+def _classify_error(e: Exception) -> Tuple[str, str]:
+    """Compact (error_code, message) pair for a failed request"""
+    if isinstance(e, httpx.TimeoutException):
+        return "timeout", "request timed out"
+    if isinstance(e, httpx.ConnectError):
+        return "connect", str(e)[:ERROR_MESSAGE_LIMIT]
+    return type(e).__name__, str(e)[:ERROR_MESSAGE_LIMIT]
+
+def _response_time_stats(response_times: List[float]) -> Dict[str, float]:
+    """min/max/avg/std_dev in one Welford pass, plus the median from a single sort"""
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    low = high = response_times[0]
+    for value in response_times:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+        if value < low:
+            low = value
+        elif value > high:
+            high = value
+    
+    ordered = sorted(response_times)
+    middle = count // 2
+    median = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+    
+    stats = {"min": low, "max": high, "avg": mean, "median": median}
+    if count > 1:
+        stats["std_dev"] = math.sqrt(m2 / (count - 1))
+    return stats
+
+
 class MinimalLoadTester:
-    def __init__(self, agent_urls: Dict[str, str]):
+    def __init__(self, agent_urls: Dict[str, str], client: Optional[httpx.AsyncClient] = None):
         """
         Initialize with agent URLs from Cloud Run
         
         Args:
             agent_urls: {"crewai": "https://crewai-agent-xyz.run.app", ...}
+            client: Optional shared client; it is left open by close()
         """
+        # A placeholder host never resolves, and every request to it would sit in connect
+        for name, url in agent_urls.items():
+            if "REPLACE" in url:
+                raise ValueError(f"{name} url not configured: {url}")
         self.agent_urls = agent_urls
+        # Endpoint URLs are built once per tester, not on every request
+        self.endpoints = {
+            name: {
+                "health": f"{url}/health",
+                "capabilities": f"{url}/capabilities",
+                "execute": f"{url}/execute",
+                "a2a": f"{url}/a2a/message"
+            }
+            for name, url in agent_urls.items()
+        }
         self.results: List[TestResult] = []
-        self.client = httpx.AsyncClient(timeout=60.0)
-        
+        self._client = client
+        self._owns_client = False
+        _acquire_log_listener()
+        self._logging = True
+        # Recent successful latencies per endpoint URL, feeding the adaptive timeouts
+        self._latency_window: Dict[str, deque] = defaultdict(lambda: deque(maxlen=64))
+    
+    async def _resolve_hosts(self):
+        """Resolve every agent host once up front, failing fast on names that do not exist"""
+        loop = asyncio.get_running_loop()
+        parsed = {name: httpx.URL(url) for name, url in self.agent_urls.items()}
+        lookups = await asyncio.gather(
+            *(loop.getaddrinfo(u.host, u.port or (443 if u.scheme == "https" else 80), type=socket.SOCK_STREAM)
+              for u in parsed.values()),
+            return_exceptions=True
+        )
+        for (name, u), infos in zip(parsed.items(), lookups):
+            if isinstance(infos, Exception):
+                raise ValueError(f"{name} host {u.host} does not resolve: {infos}") from infos
+    
+    async def __aenter__(self) -> "MinimalLoadTester":
+        try:
+            await self._resolve_hosts()
+        except ValueError:
+            await self.close()
+            raise
+        if self._client is None:
+            # Created inside the running loop so the whole run shares one pool
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=5.0),
+                # Keep connections long enough to span the pauses between tests
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=120.0),
+                headers={"User-Agent": "minimal-load-tester/1.0"}
+            )
+            self._owns_client = True
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError("MinimalLoadTester needs a client - use 'async with' or pass one in")
+        return self._client
+    
     async def close(self):
-        await self.client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
+            self._client = None
+            self._owns_client = False
+        if self._logging:
+            self._logging = False
+            _release_log_listener()
+    
+    def _timeout_for(self, url: str) -> float:
+        """Timeout for the next request to url, based on its rolling P99 latency"""
+        window = self._latency_window.get(url)
+        if window is None or len(window) < ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return DEFAULT_TIMEOUT
+        ordered = sorted(window)
+        p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+        return max(ADAPTIVE_TIMEOUT_FLOOR, p99 * ADAPTIVE_TIMEOUT_MULTIPLIER)
+    
+    async def _single_request(self, agent_name: str, test_name: str, url: str, method: str = "GET",
+                              body: Optional[bytes] = None,
+                              describe: Optional[Callable[[httpx.Response], str]] = None,
+                              timestamp: str = "") -> TestResult:
+        """Send one request to an agent and record it as a TestResult"""
+        timeout = self._timeout_for(url)
+        start_time = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, url, content=body, headers=JSON_HEADERS if body else None,
+                timeout=httpx.Timeout(timeout, connect=5.0)
+            )
+            response_time = time.perf_counter() - start_time
+            
+            if response.status_code == 200:
+                self._latency_window[url].append(response_time)
+                detail = describe(response) if describe else "OK"
+                logger.info(f"  {agent_name}: {detail} ({response_time:.2f}s)")
+            else:
+                logger.info(f"  {agent_name}: HTTP {response.status_code} ({response_time:.2f}s)")
+            
+            return TestResult(
+                test_name=test_name,
+                agent_name=agent_name,
+                status_code=response.status_code,
+                response_time=response_time,
+                success=response.status_code == 200,
+                timestamp=timestamp,
+                effective_timeout=timeout
+            )
+                
+        except Exception as e:
+            response_time = time.perf_counter() - start_time
+            error_code, error = _classify_error(e)
+            logger.info(f"  {agent_name}: {error_code} {error} ({response_time:.2f}s)")
+            return TestResult(
+                test_name=test_name,
+                agent_name=agent_name,
+                status_code=0,
+                response_time=response_time,
+                success=False,
+                error=error,
+                error_code=error_code,
+                timestamp=timestamp,
+                effective_timeout=timeout
+            )
+    
+    async def _run_test(self, spec: TestSpec) -> List[TestResult]:
+        """Run one request per agent as described by spec"""
+        logger.info(f"Running {spec.title} test...")
+        # One timestamp for the whole round instead of one clock read per result
+        now_iso = datetime.now().isoformat()
+        
+        # Agents are independent hosts, so query them concurrently
+        return await asyncio.gather(*[
+            self._single_request(
+                agent_name, spec.name, endpoints[spec.endpoint],
+                method=spec.method,
+                body=spec.body_for(agent_name),
+                describe=spec.describe,
+                timestamp=now_iso
+            )
+            for agent_name, endpoints in self.endpoints.items()
+        ])
     
     async def health_check_test(self) -> List[TestResult]:
         """Test 1: Basic health checks (3 requests)"""
-        print("Running health check test...")
-        results = []
-        
-        for agent_name, url in self.agent_urls.items():
-            start_time = time.time()
-            try:
-                response = await self.client.get(f"{url}/health")
-                response_time = time.time() - start_time
-                
-                results.append(TestResult(
-                    test_name="health_check",
-                    agent_name=agent_name,
-                    status_code=response.status_code,
-                    response_time=response_time,
-                    success=response.status_code == 200
-                ))
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"  {agent_name}: {data.get('status', 'unknown')} ({response_time:.2f}s)")
-                else:
-                    print(f"  {agent_name}: HTTP {response.status_code} ({response_time:.2f}s)")
-                    
-            except Exception as e:
-                response_time = time.time() - start_time
-                results.append(TestResult(
-                    test_name="health_check",
-                    agent_name=agent_name,
-                    status_code=0,
-                    response_time=response_time,
-                    success=False,
-                    error=str(e)
-                ))
-                print(f"  {agent_name}: {str(e)} ({response_time:.2f}s)")
-            
-            # Small delay to avoid rate limits
-            await asyncio.sleep(1)
-        
-        return results
+        return await self._run_test(HEALTH_CHECK_SPEC)
     
     async def capabilities_test(self) -> List[TestResult]:
         """Test 2: Check capabilities (3 requests)"""
-        print("Running capabilities test...")
-        results = []
-        
-        for agent_name, url in self.agent_urls.items():
-            start_time = time.time()
-            try:
-                response = await self.client.get(f"{url}/capabilities")
-                response_time = time.time() - start_time
-                
-                results.append(TestResult(
-                    test_name="capabilities",
-                    agent_name=agent_name,
-                    status_code=response.status_code,
-                    response_time=response_time,
-                    success=response.status_code == 200
-                ))
-                
-                if response.status_code == 200:
-                    capabilities = response.json()
-                    print(f"  {agent_name}: {len(capabilities)} capabilities ({response_time:.2f}s)")
-                else:
-                    print(f"  {agent_name}: HTTP {response.status_code} ({response_time:.2f}s)")
-                    
-            except Exception as e:
-                response_time = time.time() - start_time
-                results.append(TestResult(
-                    test_name="capabilities",
-                    agent_name=agent_name,
-                    status_code=0,
-                    response_time=response_time,
-                    success=False,
-                    error=str(e)
-                ))
-                print(f"  {agent_name}: {str(e)} ({response_time:.2f}s)")
-            
-            await asyncio.sleep(1)
-        
-        return results
+        return await self._run_test(CAPABILITIES_SPEC)
     
     async def basic_task_test(self) -> List[TestResult]:
         """Test 3: Basic task execution (3 requests, will likely fail with fake API keys)"""
-        print("Running basic task test...")
-        results = []
-        
-        tasks = {
-            "crewai": {
-                "task_type": "research",
-                "description": "Quick test research",
-                "context": {"test": True}
-            },
-            "langraph": {
-                "task_type": "decision_making", 
-                "description": "Quick test decision",
-                "context": {"options": ["A", "B"], "criteria": {"test": "value"}}
-            },
-            "adk": {
-                "task_type": "data_transformation",
-                "description": "Quick test transformation",
-                "context": {"data": {"test": [1, 2, 3]}, "target_format": "json"}
-            }
-        }
-        
-        for agent_name, url in self.agent_urls.items():
-            start_time = time.time()
-            try:
-                task_data = tasks.get(agent_name, tasks["crewai"])
-                response = await self.client.post(f"{url}/execute", json=task_data)
-                response_time = time.time() - start_time
-                
-                results.append(TestResult(
-                    test_name="basic_task",
-                    agent_name=agent_name,
-                    status_code=response.status_code,
-                    response_time=response_time,
-                    success=response.status_code == 200
-                ))
-                
-                if response.status_code == 200:
-                    result_data = response.json()
-                    success = result_data.get('success', False)
-                    print(f"  {agent_name}: Task executed={success} ({response_time:.2f}s)")
-                else:
-                    print(f"  {agent_name}: HTTP {response.status_code} ({response_time:.2f}s)")
-                    
-            except Exception as e:
-                response_time = time.time() - start_time
-                results.append(TestResult(
-                    test_name="basic_task",
-                    agent_name=agent_name,
-                    status_code=0,
-                    response_time=response_time,
-                    success=False,
-                    error=str(e)
-                ))
-                print(f"  {agent_name}: {str(e)} ({response_time:.2f}s)")
-            
-            await asyncio.sleep(2)  # Longer delay for task execution
-        
-        return results
+        return await self._run_test(BASIC_TASK_SPEC)
     
     async def a2a_communication_test(self) -> List[TestResult]:
         """Test 4: A2A Communication via /a2a/message endpoint (3 requests)"""
-        print("Running A2A communication test...")
-        results = []
-        
-        # Simple A2A health check message
-        a2a_message = {
-            "message_type": "health_check",
-            "sender_id": "test-client",
-            "payload": {"test": True}
-        }
+        return await self._run_test(A2A_COMMUNICATION_SPEC)
+    
+    async def latency_test(self, num_requests: int = 3, concurrency: int = 1) -> List[TestResult]:
+        """Test 5: Response time consistency (9 requests total - 3 per agent)
         
-        for agent_name, url in self.agent_urls.items():
-            start_time = time.time()
-            try:
-                response = await self.client.post(f"{url}/a2a/message", json=a2a_message)
-                response_time = time.time() - start_time
-                
-                results.append(TestResult(
-                    test_name="a2a_communication",
-                    agent_name=agent_name,
-                    status_code=response.status_code,
-                    response_time=response_time,
-                    success=response.status_code == 200
-                ))
-                
-                if response.status_code == 200:
-                    result_data = response.json()
-                    success = result_data.get('success', False)
-                    print(f"  {agent_name}: A2A response={success} ({response_time:.2f}s)")
-                else:
-                    print(f"  {agent_name}: HTTP {response.status_code} ({response_time:.2f}s)")
-                    
-            except Exception as e:
-                response_time = time.time() - start_time
-                results.append(TestResult(
-                    test_name="a2a_communication",
-                    agent_name=agent_name,
-                    status_code=0,
-                    response_time=response_time,
-                    success=False,
-                    error=str(e)
-                ))
-                print(f"  {agent_name}: {str(e)} ({response_time:.2f}s)")
+        With concurrency > 1 each agent's samples are sent up to that many at a time
+        with no pause, measuring behaviour under load instead of serial round trips.
+        """
+        logger.info(f"Running latency test ({num_requests} requests per agent, concurrency {concurrency})...")
+        now_iso = datetime.now().isoformat()
+        
+        # Pacing only matters per host, so the agents are sampled side by side
+        per_agent = await asyncio.gather(*[
+            self._agent_latency(agent_name, endpoints["health"], num_requests, now_iso, concurrency)
+            for agent_name, endpoints in self.endpoints.items()
+        ])
+        return [result for results in per_agent for result in results]
+    
+    async def _agent_latency(self, agent_name: str, health_url: str, num_requests: int, timestamp: str,
+                             concurrency: int = 1) -> List[TestResult]:
+        """Sample one agent's /health latency, serially with a pause or concurrently"""
+        if concurrency > 1:
+            slots = asyncio.Semaphore(concurrency)
+            
+            async def bounded(i: int) -> TestResult:
+                async with slots:
+                    return await self._one_latency(agent_name, health_url, i, timestamp)
             
-            await asyncio.sleep(1)
+            # gather keeps start order; completion order shows in the log lines
+            return await asyncio.gather(*[bounded(i) for i in range(num_requests)])
         
-        return results
-    
-    async def latency_test(self, num_requests: int = 3) -> List[TestResult]:
-        """Test 5: Response time consistency (9 requests total - 3 per agent)"""
-        print(f"Running latency test ({num_requests} requests per agent)...")
         results = []
-        
-        for agent_name, url in self.agent_urls.items():
-            print(f"  Testing {agent_name} latency...")
-            
-            for i in range(num_requests):
-                start_time = time.time()
-                try:
-                    response = await self.client.get(f"{url}/health")
-                    response_time = time.time() - start_time
-                    
-                    results.append(TestResult(
-                        test_name=f"latency_test_{i+1}",
-                        agent_name=agent_name,
-                        status_code=response.status_code,
-                        response_time=response_time,
-                        success=response.status_code == 200
-                    ))
-                    
-                    print(f"    Request {i+1}: {response_time:.3f}s")
-                    
-                except Exception as e:
-                    response_time = time.time() - start_time
-                    results.append(TestResult(
-                        test_name=f"latency_test_{i+1}",
-                        agent_name=agent_name,
-                        status_code=0,
-                        response_time=response_time,
-                        success=False,
-                        error=str(e)
-                    ))
-                    print(f"    Request {i+1}: ERROR - {str(e)}")
-                
-                await asyncio.sleep(1)  # 1 second between requests
+        for i in range(num_requests):
+            results.append(await self._one_latency(agent_name, health_url, i, timestamp))
+            if i < num_requests - 1:
+                await asyncio.sleep(1)  # 1 second between requests to the same agent
         
         return results
     
+    async def _one_latency(self, agent_name: str, health_url: str, i: int, timestamp: str) -> TestResult:
+        """Time a single /health request for the latency test"""
+        timeout = self._timeout_for(health_url)
+        start_time = time.perf_counter()
+        try:
+            # Only the status matters here: time to the headers and skip JSON parsing. The tiny body is
+            # still drained so HTTP/1.1 connections go back to the pool instead of being closed.
+            async with self.client.stream("GET", health_url, timeout=httpx.Timeout(timeout, connect=5.0)) as response:
+                response_time = time.perf_counter() - start_time
+                await response.aread()
+            if response.status_code == 200:
+                self._latency_window[health_url].append(response_time)
+            
+            logger.info(f"  {agent_name} request {i+1}: {response_time:.3f}s")
+            return TestResult(
+                test_name=f"latency_test_{i+1}",
+                agent_name=agent_name,
+                status_code=response.status_code,
+                response_time=response_time,
+                success=response.status_code == 200,
+                timestamp=timestamp,
+                effective_timeout=timeout
+            )
+            
+        except Exception as e:
+            response_time = time.perf_counter() - start_time
+            error_code, error = _classify_error(e)
+            logger.info(f"  {agent_name} request {i+1}: ERROR - {error_code} {error}")
+            return TestResult(
+                test_name=f"latency_test_{i+1}",
+                agent_name=agent_name,
+                status_code=0,
+                response_time=response_time,
+                success=False,
+                error=error,
+                error_code=error_code,
+                timestamp=timestamp,
+                effective_timeout=timeout
+            )
+    
     def analyze_results(self, results: List[TestResult]) -> Dict[str, Any]:
         """Analyze test results and generate summary statistics"""
         if not results:
             return {"error": "No results to analyze"}
         
         # Group results by test type
-        test_groups = {}
+        test_groups = defaultdict(list)
         for result in results:
-            test_name = result.test_name
-            if test_name not in test_groups:
-                test_groups[test_name] = []
-            test_groups[test_name].append(result)
+            test_groups[result.test_name].append(result)
         
         # Calculate statistics for each test group
         analysis = {}
+        successful_requests = 0
         
         for test_name, test_results in test_groups.items():
-            successful_results = [r for r in test_results if r.success]
+            # One pass splits successes from failures
+            response_times = []
+            failed_results = []
+            for r in test_results:
+                if r.success:
+                    response_times.append(r.response_time)
+                else:
+                    failed_results.append(r)
+            successful_requests += len(response_times)
             
-            if successful_results:
-                response_times = [r.response_time for r in successful_results]
+            if response_times:
                 analysis[test_name] = {
                     "total_requests": len(test_results),
-                    "successful_requests": len(successful_results),
-                    "success_rate": len(successful_results) / len(test_results) * 100,
-                    "response_time_stats": {
-                        "min": min(response_times),
-                        "max": max(response_times),
-                        "avg": statistics.mean(response_times),
-                        "median": statistics.median(response_times),
-                    }
+                    "successful_requests": len(response_times),
+                    "success_rate": len(response_times) / len(test_results) * 100,
+                    "response_time_stats": _response_time_stats(response_times)
                 }
-                
-                if len(response_times) > 1:
-                    analysis[test_name]["response_time_stats"]["std_dev"] = statistics.stdev(response_times)
             else:
                 analysis[test_name] = {
                     "total_requests": len(test_results),
                     "successful_requests": 0,
                     "success_rate": 0,
-                    "errors": [r.error for r in test_results if r.error]
+                    "errors": [r.error for r in failed_results if r.error]
                 }
         
-        # Overall statistics
+        # Overall statistics - successes were already counted per group
         total_requests = len(results)
-        successful_requests = len([r for r in results if r.success])
         
         analysis["overall"] = {
             "total_requests": total_requests,
             "successful_requests": successful_requests,
             "overall_success_rate": successful_requests / total_requests * 100 if total_requests > 0 else 0,
-            "test_duration": max([r.timestamp for r in results]) if results else "N/A"
+            "test_duration": max((r.timestamp for r in results), default="N/A")
         }
         
         return analysis
     
     def print_analysis(self, analysis: Dict[str, Any]):
         """Print analysis in human-readable format"""
-        print("\n" + "="*60)
-        print("LOAD TEST ANALYSIS RESULTS")
-        print("="*60)
+        logger.info("\n" + "="*60)
+        logger.info("LOAD TEST ANALYSIS RESULTS")
+        logger.info("="*60)
         
         # Overall stats
         overall = analysis.get("overall", {})
-        print(f"Total Requests: {overall.get('total_requests', 0)}")
-        print(f"Successful Requests: {overall.get('successful_requests', 0)}")
-        print(f"Overall Success Rate: {overall.get('overall_success_rate', 0):.1f}%")
-        print()
+        logger.info(f"Total Requests: {overall.get('total_requests', 0)}")
+        logger.info(f"Successful Requests: {overall.get('successful_requests', 0)}")
+        logger.info(f"Overall Success Rate: {overall.get('overall_success_rate', 0):.1f}%")
+        logger.info("")
         
         # Individual test results
         for test_name, stats in analysis.items():
             if test_name == "overall":
                 continue
                 
-            print(f"Test: {test_name.replace('_', ' ').title()}")
-            print(f"  Requests: {stats.get('total_requests', 0)}")
-            print(f"  Success Rate: {stats.get('success_rate', 0):.1f}%")
+            logger.info(f"Test: {test_name.replace('_', ' ').title()}")
+            logger.info(f"  Requests: {stats.get('total_requests', 0)}")
+            logger.info(f"  Success Rate: {stats.get('success_rate', 0):.1f}%")
             
             if "response_time_stats" in stats:
                 rt_stats = stats["response_time_stats"]
-                print(f"  Response Time (avg): {rt_stats.get('avg', 0):.3f}s")
-                print(f"  Response Time (min/max): {rt_stats.get('min', 0):.3f}s / {rt_stats.get('max', 0):.3f}s")
+                logger.info(f"  Response Time (avg): {rt_stats.get('avg', 0):.3f}s")
+                logger.info(f"  Response Time (min/max): {rt_stats.get('min', 0):.3f}s / {rt_stats.get('max', 0):.3f}s")
                 
             if "errors" in stats and stats["errors"]:
-                print(f"  Errors: {stats['errors'][:3]}")  # Show first 3 errors
-            print()
+                logger.info(f"  Errors: {stats['errors'][:3]}")  # Show first 3 errors
+            logger.info("")
     
     def save_results(self, results: List[TestResult], filename: str = None):
         """Save results to JSON file"""
@@ -369,22 +510,23 @@ class MinimalLoadTester:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"load_test_results_{timestamp}.json"
         
-        # Convert dataclasses to dict
-        results_dict = [asdict(result) for result in results]
+        # orjson serializes the TestResult dataclasses directly, no asdict() copies
+        payload = {
+            "test_run_timestamp": datetime.now().isoformat(),
+            "total_requests": len(results),
+            "agent_urls": self.agent_urls,
+            "results": results
+        }
         
-        with open(filename, 'w') as f:
-            json.dump({
-                "test_run_timestamp": datetime.now().isoformat(),
-                "total_requests": len(results),
-                "agent_urls": self.agent_urls,
-                "results": results_dict
-            }, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
         
-        print(f"Results saved to: {filename}")
+        logger.info(f"Results saved to: {filename}")
     
     async def collaboration_test(self) -> List[TestResult]:
         """Test 5: Agent Collaboration Test - Real A2A Workflow"""
-        print("Running agent collaboration test...")
+        logger.info("Running agent collaboration test...")
+        now_iso = datetime.now().isoformat()
         results = []
         
         # Test full collaboration chain: Research -> Decision -> Data Processing
@@ -436,24 +578,25 @@ class MinimalLoadTester:
             scenario_name = scenario["name"]
             
             if agent_name not in self.agent_urls:
-                print(f"  Skipping {scenario_name}: {agent_name} agent not available")
+                logger.info(f"  Skipping {scenario_name}: {agent_name} agent not available")
                 continue
                 
-            url = self.agent_urls[agent_name]
+            execute_url = self.endpoints[agent_name]["execute"]
             task_data = scenario["task"]
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
-                print(f"  Testing {scenario_name} with {agent_name} agent...")
-                response = await self.client.post(f"{url}/execute", json=task_data)
-                response_time = time.time() - start_time
+                logger.info(f"  Testing {scenario_name} with {agent_name} agent...")
+                response = await self.client.post(execute_url, json=task_data)
+                response_time = time.perf_counter() - start_time
                 
                 results.append(TestResult(
                     test_name=f"collaboration_{scenario_name}",
                     agent_name=agent_name,
                     status_code=response.status_code,
                     response_time=response_time,
-                    success=response.status_code == 200
+                    success=response.status_code == 200,
+                    timestamp=now_iso
                 ))
                 
                 if response.status_code == 200:
@@ -464,26 +607,29 @@ class MinimalLoadTester:
                     collaboration_data = result_data.get('result', {}).get('collaboration', {})
                     collaborators_used = len(collaboration_data) if collaboration_data else 0
                     
-                    print(f"    {scenario_name}: Task success={success}, Collaborators used={collaborators_used} ({response_time:.2f}s)")
+                    logger.info(f"    {scenario_name}: Task success={success}, Collaborators used={collaborators_used} ({response_time:.2f}s)")
                     
                     if collaboration_data:
                         for collaborator, collab_result in collaboration_data.items():
                             collab_success = collab_result.get('task_result', {}).get('success', False)
-                            print(f"    -> {collaborator}: {collab_success}")
+                            logger.info(f"    -> {collaborator}: {collab_success}")
                 else:
-                    print(f"    {scenario_name}: HTTP {response.status_code} ({response_time:.2f}s)")
+                    logger.info(f"    {scenario_name}: HTTP {response.status_code} ({response_time:.2f}s)")
                     
             except Exception as e:
-                response_time = time.time() - start_time
+                response_time = time.perf_counter() - start_time
+                error_code, error = _classify_error(e)
                 results.append(TestResult(
                     test_name=f"collaboration_{scenario_name}",
                     agent_name=agent_name,
                     status_code=0,
                     response_time=response_time,
                     success=False,
-                    error=str(e)
+                    error=error,
+                    error_code=error_code,
+                    timestamp=now_iso
                 ))
-                print(f"    {scenario_name}: {str(e)} ({response_time:.2f}s)")
+                logger.info(f"    {scenario_name}: {error_code} {error} ({response_time:.2f}s)")
             
             await asyncio.sleep(3)  # Longer delay for collaboration tests
         
@@ -491,10 +637,10 @@ class MinimalLoadTester:
 
     async def run_all_tests(self) -> List[TestResult]:
         """Run all test scenarios"""
-        print("Starting minimal load testing suite...")
-        print(f"Testing agents: {list(self.agent_urls.keys())}")
-        print(f"Estimated total requests: ~30 (including collaboration)")
-        print()
+        logger.info("Starting minimal load testing suite...")
+        logger.info(f"Testing agents: {list(self.agent_urls.keys())}")
+        logger.info(f"Estimated total requests: ~30 (including collaboration)")
+        logger.info("")
         
         all_results = []
         
@@ -529,9 +675,9 @@ class MinimalLoadTester:
             all_results.extend(task_results)
             
         except KeyboardInterrupt:
-            print("Testing interrupted by user")
+            logger.info("Testing interrupted by user")
         except Exception as e:
-            print(f"Testing failed: {e}")
+            logger.info(f"Testing failed: {e}")
         
         self.results = all_results
         return all_results
@@ -547,13 +693,13 @@ async def main():
         "adk": "https://adk-agent-REPLACE-run.app"
     }
     
-    # Replace with your actual Cloud Run URLs
-    print("Please update agent_urls with your actual Cloud Run URLs")
-    return
-    
-    tester = MinimalLoadTester(agent_urls)
-    
     try:
+        tester = MinimalLoadTester(agent_urls)
+    except ValueError as e:
+        print(f"Please update agent_urls with your actual Cloud Run URLs ({e})")
+        return
+    
+    async with tester:
         # Run all tests
         results = await tester.run_all_tests()
         
@@ -564,11 +710,14 @@ async def main():
         # Save results
         tester.save_results(results)
         
-        print(f"\nCompleted {len(results)} total requests")
-        
-    finally:
-        await tester.close()
+        logger.info(f"\nCompleted {len(results)} total requests")
 
 
 if __name__ == "__main__":
+    # uvloop (installed with uvicorn[standard]) lowers per-await overhead; fall back to asyncio's loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
@@ -1,7 +1,11 @@
 # test_agents.py
-import requests
-import json
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Twoje Cloud Run URLs
 AGENT_URLS = {
@@ -10,6 +14,16 @@ AGENT_URLS = {
    "adk": os.getenv("ADK_URL", "https://adk-agent-REPLACE.run.app")
 }
 
+# Jedna sesja z pulą połączeń - kolejne wywołania do agenta reużywają połączenia keep-alive
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
 # Przykładowe zadania dopasowane do każdego agenta
 TEST_TASKS = {
     "crewai": {
@@ -32,53 +46,62 @@ TEST_TASKS = {
     }
 }
 
-def test_agent(name, url):
-    print(f"\nTesting {name} agent...")
+def test_agent(name, url, out=None):
+    print(f"\nTesting {name} agent...", file=out)
 
     try:
         # Health check
-        response = requests.get(f"{url}/health", timeout=10)
-        print(f"Health: {response.status_code} - {response.json()}")
+        response = SESSION.get(f"{url}/health", timeout=10)
+        print(f"Health: {response.status_code} - {response.json()}", file=out)
 
         # Capabilities
-        response = requests.get(f"{url}/capabilities", timeout=10)
+        response = SESSION.get(f"{url}/capabilities", timeout=10)
         capabilities = response.json()
-        print(f"Capabilities: {response.status_code} - {len(capabilities)} capabilities")
+        print(f"Capabilities: {response.status_code} - {len(capabilities)} capabilities", file=out)
 
         # Spec
-        response = requests.get(f"{url}/spec", timeout=10)
+        response = SESSION.get(f"{url}/spec", timeout=10)
         spec = response.json()
-        print(f"Spec: {response.status_code} - Agent: {spec.get('agent_id', 'unknown')}")
+        print(f"Spec: {response.status_code} - Agent: {spec.get('agent_id', 'unknown')}", file=out)
 
         # Execute task
         test_task = TEST_TASKS.get(name)
         if test_task:
-            headers = {"Content-Type": "application/json"}
-            response = requests.post(f"{url}/execute", data=json.dumps(test_task), headers=headers, timeout=30)
+            response = SESSION.post(f"{url}/execute", json=test_task, timeout=30)
 
             if response.status_code == 200:
                 result = response.json()
-                print(f"Execute: {response.status_code} - Success: {result['success']} - Result: {result.get('result', {})}")
+                print(f"Execute: {response.status_code} - Success: {result['success']} - Result: {result.get('result', {})}", file=out)
             else:
-                print(f"Execute: {response.status_code} - Failed to execute task: {response.text}")
+                print(f"Execute: {response.status_code} - Failed to execute task: {response.text}", file=out)
         else:
-            print("⚠️ No test task defined for this agent.")
+            print("⚠️ No test task defined for this agent.", file=out)
 
         return True
 
     except Exception as e:
-        print(f"ERROR: {e}")
+        print(f"ERROR: {e}", file=out)
         return False
 
+def _test_agent_buffered(name, url):
+    # Każdy wątek pisze do własnego bufora, żeby wyjście agentów się nie przeplatało
+    buffer = io.StringIO()
+    success = test_agent(name, url, out=buffer)
+    return success, buffer.getvalue()
+
 if __name__ == "__main__":
     print("Testing Cloud Run Agents...")
 
-    for name, url in AGENT_URLS.items():
-        success = test_agent(name, url)
-        if not success:
-            print(f"❌ {name} agent failed")
-        else:
-            print(f"✅ {name} agent OK")
-
-    print("\nDone!")
+    # Agenci są niezależni - testuj ich równolegle
+    with ThreadPoolExecutor(max_workers=len(AGENT_URLS)) as executor:
+        futures = {executor.submit(_test_agent_buffered, name, url): name for name, url in AGENT_URLS.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            success, output = future.result()
+            print(output, end="")
+            if not success:
+                print(f"❌ {name} agent failed")
+            else:
+                print(f"✅ {name} agent OK")
 
+    print("\nDone!")
\ No newline at end of file
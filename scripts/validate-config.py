@@ -8,15 +8,29 @@ import yaml
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# libyaml's C loader when PyYAML was built with it, otherwise the pure-Python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Tuples give the order of the error messages; the frozensets give a one-step "all present" check
+REQUIRED_AGENT_FIELDS = ('name', 'service', 'port', 'description', 'resources')
+REQUIRED_RESOURCE_FIELDS = ('cpu', 'memory', 'min_instances', 'max_instances', 'concurrency')
+REQUIRED_AGENT_FIELD_SET = frozenset(REQUIRED_AGENT_FIELDS)
+REQUIRED_RESOURCE_FIELD_SET = frozenset(REQUIRED_RESOURCE_FIELDS)
+
 class ConfigValidator:
     def __init__(self, config_path: str = ".github/configs/agents.yaml"):
         self.config_path = config_path
         self.errors = []
         self.warnings = []
         self.config = None
+        self._agent_fs_index: Optional[Dict[str, Dict[str, bool]]] = None
         
     def load_config(self) -> bool:
         """Load and parse YAML configuration"""
@@ -25,8 +39,9 @@ class ConfigValidator:
                 self.errors.append(f"Configuration file not found: {self.config_path}")
                 return False
                 
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            with open(self.config_path, 'rb') as f:
+                self.config = yaml.load(f, Loader=_Loader)
+            self._agent_fs_index = self._index_agent_dirs()
             return True
         except yaml.YAMLError as e:
             self.errors.append(f"YAML parsing error: {e}")
@@ -35,6 +50,29 @@ class ConfigValidator:
             self.errors.append(f"Error loading config: {e}")
             return False
     
+    def _index_agent_dirs(self, agents_dir: str = "agents") -> Optional[Dict[str, Dict[str, bool]]]:
+        """Scan agents/ once and record which agent directories have a Dockerfile and requirements.txt"""
+        if not os.path.isdir(agents_dir):
+            return None
+        
+        with os.scandir(agents_dir) as entries:
+            agent_dirs = [entry for entry in entries if entry.is_dir()]
+        if not agent_dirs:
+            return {}
+        
+        # The stat calls are I/O bound, which adds up on network-backed CI volumes
+        with ThreadPoolExecutor(max_workers=min(16, len(agent_dirs))) as executor:
+            probes = executor.map(self._probe_agent_dir, agent_dirs)
+            return {entry.name: files for entry, files in zip(agent_dirs, probes)}
+    
+    @staticmethod
+    def _probe_agent_dir(entry: os.DirEntry) -> Dict[str, bool]:
+        """Check one agent directory for the files validate_agents expects"""
+        return {
+            "dockerfile": os.path.exists(os.path.join(entry.path, "Dockerfile")),
+            "requirements": os.path.exists(os.path.join(entry.path, "requirements.txt"))
+        }
+    
     def validate_structure(self) -> None:
         """Validate basic configuration structure"""
         required_sections = ['agents', 'global', 'environments', 'labels']
@@ -55,9 +93,6 @@ class ConfigValidator:
         if 'agents' not in self.config:
             return
             
-        required_agent_fields = ['name', 'service', 'port', 'description', 'resources']
-        required_resource_fields = ['cpu', 'memory', 'min_instances', 'max_instances', 'concurrency']
-        
         agent_names = set()
         agent_services = set()
         agent_ports = set()
@@ -66,9 +101,11 @@ class ConfigValidator:
             prefix = f"Agent {i+1}"
             
             # Check required fields
-            for field in required_agent_fields:
-                if field not in agent:
-                    self.errors.append(f"{prefix}: Missing required field '{field}'")
+            if not agent.keys() >= REQUIRED_AGENT_FIELD_SET:
+                self.errors.extend(
+                    f"{prefix}: Missing required field '{field}'"
+                    for field in REQUIRED_AGENT_FIELDS if field not in agent
+                )
             
             if 'name' in agent:
                 # Check for duplicates
@@ -78,18 +115,17 @@ class ConfigValidator:
                 
                 # Check agent directory exists
                 agent_dir = f"agents/{agent['name']}"
-                if not os.path.exists(agent_dir):
+                agent_files = (self._agent_fs_index or {}).get(agent['name'])
+                if agent_files is None:
                     self.errors.append(f"{prefix}: Agent directory not found: {agent_dir}")
                 else:
                     # Check for Dockerfile
-                    dockerfile_path = f"{agent_dir}/Dockerfile"
-                    if not os.path.exists(dockerfile_path):
-                        self.errors.append(f"{prefix}: Dockerfile not found: {dockerfile_path}")
+                    if not agent_files["dockerfile"]:
+                        self.errors.append(f"{prefix}: Dockerfile not found: {agent_dir}/Dockerfile")
                     
                     # Check for requirements.txt
-                    requirements_path = f"{agent_dir}/requirements.txt"
-                    if not os.path.exists(requirements_path):
-                        self.warnings.append(f"{prefix}: requirements.txt not found: {requirements_path}")
+                    if not agent_files["requirements"]:
+                        self.warnings.append(f"{prefix}: requirements.txt not found: {agent_dir}/requirements.txt")
             
             if 'service' in agent:
                 if agent['service'] in agent_services:
@@ -115,9 +151,11 @@ class ConfigValidator:
                     self.errors.append(f"{prefix}: Missing 'prod' environment in resources")
                 else:
                     prod_resources = agent['resources']['prod']
-                    for field in required_resource_fields:
-                        if field not in prod_resources:
-                            self.errors.append(f"{prefix}: Missing resource field '{field}' for prod environment")
+                    if not prod_resources.keys() >= REQUIRED_RESOURCE_FIELD_SET:
+                        self.errors.extend(
+                            f"{prefix}: Missing resource field '{field}' for prod environment"
+                            for field in REQUIRED_RESOURCE_FIELDS if field not in prod_resources
+                        )
                     
                     # Validate resource values
                     self._validate_resource_values(f"{prefix} (prod)", prod_resources)
@@ -192,7 +230,7 @@ class ConfigValidator:
     def check_agent_directories(self) -> None:
         """Check for agent directories without configuration"""
         agents_dir = "agents"
-        if not os.path.exists(agents_dir):
+        if self._agent_fs_index is None:
             self.warnings.append(f"Agents directory not found: {agents_dir}")
             return
         
@@ -200,10 +238,9 @@ class ConfigValidator:
         if self.config and 'agents' in self.config:
             configured_agents = {agent['name'] for agent in self.config['agents']}
         
-        # Find directories in agents/
-        for item in os.listdir(agents_dir):
-            item_path = os.path.join(agents_dir, item)
-            if os.path.isdir(item_path) and not item.startswith('.'):
+        # Directories in agents/ were indexed by load_config
+        for item in self._agent_fs_index:
+            if not item.startswith('.'):
                 if item not in configured_agents:
                     self.warnings.append(f"Agent directory '{item}' exists but not configured in agents.yaml")
     
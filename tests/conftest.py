@@ -0,0 +1,32 @@
+"""
+Shared fixtures for the agent tests
+"""
+import importlib.util
+
+import httpx
+import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+
+# HTTP/2 needs the h2 package (httpx[http2]); it is negotiated over TLS, so local http:// runs stay on HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_client():
+    """One pooled HTTP client for the whole session, so tests reuse keep-alive connections"""
+    client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=300),
+        timeout=httpx.Timeout(30.0)
+    )
+    yield client
+    await client.aclose()
+
+
+def pytest_collection_modifyitems(items):
+    """Run tests that use shared_client on the session loop the client's connections belong to"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and "shared_client" in getattr(item, "fixturenames", ()):
+            item.add_marker(session_loop, append=False)
@@ -30,17 +30,21 @@ async def test_health_checks():
         "ADK": ADK_AGENT_URL
     }
     
-    for name, url in agents.items():
-        try:
-            response = await client.health_check(url)
-            if response.success:
-                status = response.payload.get("status", "unknown")
-                agent_id = response.payload.get("agent_id", "unknown")
-                print(f"  {name} Agent ({agent_id}): {status}")
-            else:
-                print(f"  {name} Agent: {response.error}")
-        except Exception as e:
-            print(f"  {name} Agent: Connection failed - {e}")
+    # Query all agents at once, then report in a fixed order
+    responses = await asyncio.gather(
+        *(client.health_check(url) for url in agents.values()),
+        return_exceptions=True
+    )
+    
+    for name, response in zip(agents, responses):
+        if isinstance(response, Exception):
+            print(f"  {name} Agent: Connection failed - {response}")
+        elif response.success:
+            status = response.payload.get("status", "unknown")
+            agent_id = response.payload.get("agent_id", "unknown")
+            print(f"  {name} Agent ({agent_id}): {status}")
+        else:
+            print(f"  {name} Agent: {response.error}")
     
     print()
 
@@ -56,18 +60,21 @@ async def test_capabilities_discovery():
         "ADK": ADK_AGENT_URL
     }
     
-    for name, url in agents.items():
-        try:
-            response = await client.get_capabilities(url)
-            if response.success:
-                capabilities = response.payload.get("capabilities", [])
-                print(f"  {name} Agent capabilities:")
-                for cap in capabilities:
-                    print(f"    - {cap.get('name', 'unknown')}: {cap.get('description', '')}")
-            else:
-                print(f"  {name} Agent capabilities: {response.error}")
-        except Exception as e:
-            print(f"  {name} Agent: Connection failed - {e}")
+    responses = await asyncio.gather(
+        *(client.get_capabilities(url) for url in agents.values()),
+        return_exceptions=True
+    )
+    
+    for name, response in zip(agents, responses):
+        if isinstance(response, Exception):
+            print(f"  {name} Agent: Connection failed - {response}")
+        elif response.success:
+            capabilities = response.payload.get("capabilities", [])
+            print(f"  {name} Agent capabilities:")
+            for cap in capabilities:
+                print(f"    - {cap.get('name', 'unknown')}: {cap.get('description', '')}")
+        else:
+            print(f"  {name} Agent capabilities: {response.error}")
     
     print()
 
@@ -15,33 +15,31 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../agents/crewai-agent'
 
 BASE_URL = "http://localhost:8080"
 
-async def test_health():
+async def test_health(shared_client):
     """Test health endpoint"""
     print("Testing CrewAI Agent health...")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/health")
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Agent ID: {data.get('agent_id')}")
-            print(f"Status: {data.get('status')}")
-            print(f"Uptime: {data.get('uptime'):.2f}s")
-        print()
+    response = await shared_client.get(f"{BASE_URL}/health")
+    print(f"Status: {response.status_code}")
+    if response.status_code == 200:
+        data = response.json()
+        print(f"Agent ID: {data.get('agent_id')}")
+        print(f"Status: {data.get('status')}")
+        print(f"Uptime: {data.get('uptime'):.2f}s")
+    print()
 
-async def test_capabilities():
+async def test_capabilities(shared_client):
     """Test capabilities endpoint"""
     print("Testing capabilities...")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/capabilities")
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            capabilities = response.json()
-            print(f"Capabilities count: {len(capabilities)}")
-            for cap in capabilities:
-                print(f"  - {cap['name']}: {cap['description']}")
-        print()
+    response = await shared_client.get(f"{BASE_URL}/capabilities")
+    print(f"Status: {response.status_code}")
+    if response.status_code == 200:
+        capabilities = response.json()
+        print(f"Capabilities count: {len(capabilities)}")
+        for cap in capabilities:
+            print(f"  - {cap['name']}: {cap['description']}")
+    print()
 
-async def test_research_task():
+async def test_research_task(shared_client):
     """Test research capability"""
     print("Testing research task...")
     
@@ -51,21 +49,20 @@ async def test_research_task():
         "context": {"focus": "solar and wind power"}
     }
     
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        response = await client.post(f"{BASE_URL}/execute", json=task_request)
-        print(f"Status: {response.status_code}")
+    response = await shared_client.post(f"{BASE_URL}/execute", json=task_request, timeout=300.0)
+    print(f"Status: {response.status_code}")
+    
+    if response.status_code == 200:
+        result = response.json()
+        print(f"Success: {result['success']}")
+        print(f"Execution time: {result['execution_time']:.2f}s")
         
-        if response.status_code == 200:
-            result = response.json()
-            print(f"Success: {result['success']}")
-            print(f"Execution time: {result['execution_time']:.2f}s")
-            
-            if result['success'] and result.get('result', {}).get('summary'):
-                summary = result['result']['summary']
-                print(f"Summary: {summary[:150]}...")
-        print()
+        if result['success'] and result.get('result', {}).get('summary'):
+            summary = result['result']['summary']
+            print(f"Summary: {summary[:150]}...")
+    print()
 
-async def test_analysis_task():
+async def test_analysis_task(shared_client):
     """Test analysis capability"""
     print("Testing analysis task...")
     
@@ -75,29 +72,29 @@ async def test_analysis_task():
         "context": {"timeframe": "2024", "regions": ["US", "EU", "China"]}
     }
     
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        response = await client.post(f"{BASE_URL}/execute", json=task_request)
-        print(f"Status: {response.status_code}")
+    response = await shared_client.post(f"{BASE_URL}/execute", json=task_request, timeout=300.0)
+    print(f"Status: {response.status_code}")
+    
+    if response.status_code == 200:
+        result = response.json()
+        print(f"Success: {result['success']}")
+        print(f"Execution time: {result['execution_time']:.2f}s")
         
-        if response.status_code == 200:
-            result = response.json()
-            print(f"Success: {result['success']}")
-            print(f"Execution time: {result['execution_time']:.2f}s")
-            
-            if result['success']:
-                analysis = result.get('result', {}).get('analysis', '')
-                print(f"Analysis preview: {analysis[:150]}...")
-        print()
+        if result['success']:
+            analysis = result.get('result', {}).get('analysis', '')
+            print(f"Analysis preview: {analysis[:150]}...")
+    print()
 
 async def main():
     """Run all CrewAI Agent tests"""
     print("Starting CrewAI Agent Individual Tests\n")
     
     try:
-        await test_health()
-        await test_capabilities()
-        await test_research_task()
-        await test_analysis_task()
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            await test_health(client)
+            await test_capabilities(client)
+            await test_research_task(client)
+            await test_analysis_task(client)
         
         print("CrewAI Agent tests completed!")
         
@@ -15,33 +15,31 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../agents/langraph-agen
 
 BASE_URL = "http://localhost:8082"
 
-async def test_health():
+async def test_health(shared_client):
     """Test health endpoint"""
     print("Testing LangGraph Agent health...")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/health")
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Agent ID: {data.get('agent_id')}")
-            print(f"Status: {data.get('status')}")
-            print(f"Uptime: {data.get('uptime'):.2f}s")
-        print()
+    response = await shared_client.get(f"{BASE_URL}/health")
+    print(f"Status: {response.status_code}")
+    if response.status_code == 200:
+        data = response.json()
+        print(f"Agent ID: {data.get('agent_id')}")
+        print(f"Status: {data.get('status')}")
+        print(f"Uptime: {data.get('uptime'):.2f}s")
+    print()
 
-async def test_capabilities():
+async def test_capabilities(shared_client):
     """Test capabilities endpoint"""
     print("Testing capabilities...")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/capabilities")
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            capabilities = response.json()
-            print(f"Capabilities count: {len(capabilities)}")
-            for cap in capabilities:
-                print(f"  - {cap['name']}: {cap['description']}")
-        print()
+    response = await shared_client.get(f"{BASE_URL}/capabilities")
+    print(f"Status: {response.status_code}")
+    if response.status_code == 200:
+        capabilities = response.json()
+        print(f"Capabilities count: {len(capabilities)}")
+        for cap in capabilities:
+            print(f"  - {cap['name']}: {cap['description']}")
+    print()
 
-async def test_decision_making():
+async def test_decision_making(shared_client):
     """Test decision making capability"""
     print("Testing decision making...")
     
@@ -54,22 +52,21 @@ async def test_decision_making():
         }
     }
     
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        response = await client.post(f"{BASE_URL}/execute", json=task_request)
-        print(f"Status: {response.status_code}")
+    response = await shared_client.post(f"{BASE_URL}/execute", json=task_request, timeout=300.0)
+    print(f"Status: {response.status_code}")
+    
+    if response.status_code == 200:
+        result = response.json()
+        print(f"Success: {result['success']}")
+        print(f"Execution time: {result['execution_time']:.2f}s")
         
-        if response.status_code == 200:
-            result = response.json()
-            print(f"Success: {result['success']}")
-            print(f"Execution time: {result['execution_time']:.2f}s")
-            
-            if result['success']:
-                decision_result = result.get('result', {})
-                print(f"Decision: {decision_result.get('decision', 'No decision')}")
-                print(f"Confidence: {decision_result.get('confidence', 0)}")
-        print()
+        if result['success']:
+            decision_result = result.get('result', {})
+            print(f"Decision: {decision_result.get('decision', 'No decision')}")
+            print(f"Confidence: {decision_result.get('confidence', 0)}")
+    print()
 
-async def test_routing():
+async def test_routing(shared_client):
     """Test routing capability"""
     print("Testing routing...")
     
@@ -90,30 +87,30 @@ async def test_routing():
         }
     }
     
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        response = await client.post(f"{BASE_URL}/execute", json=task_request)
-        print(f"Status: {response.status_code}")
+    response = await shared_client.post(f"{BASE_URL}/execute", json=task_request, timeout=300.0)
+    print(f"Status: {response.status_code}")
+    
+    if response.status_code == 200:
+        result = response.json()
+        print(f"Success: {result['success']}")
+        print(f"Execution time: {result['execution_time']:.2f}s")
         
-        if response.status_code == 200:
-            result = response.json()
-            print(f"Success: {result['success']}")
-            print(f"Execution time: {result['execution_time']:.2f}s")
-            
-            if result['success']:
-                routing_result = result.get('result', {})
-                print(f"Route: {routing_result.get('route', 'No route')}")
-                print(f"Reason: {routing_result.get('routing_reason', 'No reason')[:100]}...")
-        print()
+        if result['success']:
+            routing_result = result.get('result', {})
+            print(f"Route: {routing_result.get('route', 'No route')}")
+            print(f"Reason: {routing_result.get('routing_reason', 'No reason')[:100]}...")
+    print()
 
 async def main():
     """Run all LangGraph Agent tests"""
     print("Starting LangGraph Agent Individual Tests\n")
     
     try:
-        await test_health()
-        await test_capabilities()
-        await test_decision_making()
-        await test_routing()
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            await test_health(client)
+            await test_capabilities(client)
+            await test_decision_making(client)
+            await test_routing(client)
         
         print("LangGraph Agent tests completed!")
         